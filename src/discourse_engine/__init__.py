@@ -1,23 +1,21 @@
 """Discourse Intelligence Engine - NLP-driven analysis of structural logic in language."""
 
-from discourse_engine.main import run_pipeline, format_report
-from discourse_engine.models.report import Report
-from discourse_engine.v4.dialogue_pipeline import (
-    parse_speaker_tagged_text,
-    run_dialogue_analysis,
-    dialogue_report_to_dict,
-    format_dialogue_report,
-)
-from discourse_engine.v4.models import DialogueReport
+from discourse_engine.utils.lazy import lazy_exports
 
-__all__ = [
-    "run_pipeline",
-    "format_report",
-    "Report",
+# Public names resolve lazily (PEP 562): importing the package, or any subpackage such as
+# discourse_engine.v3, no longer loads every analyzer, lexicon and compiled pattern up front.
+_LAZY_EXPORTS = {
+    "run_pipeline": "discourse_engine.main",
+    "format_report": "discourse_engine.main",
+    "Report": "discourse_engine.models.report",
     # v4 dialogue API
-    "run_dialogue_analysis",
-    "parse_speaker_tagged_text",
-    "dialogue_report_to_dict",
-    "format_dialogue_report",
-    "DialogueReport",
-]
+    "run_dialogue_analysis": "discourse_engine.v4.dialogue_pipeline",
+    "parse_speaker_tagged_text": "discourse_engine.v4.dialogue_pipeline",
+    "dialogue_report_to_dict": "discourse_engine.v4.dialogue_pipeline",
+    "format_dialogue_report": "discourse_engine.v4.dialogue_pipeline",
+    "DialogueReport": "discourse_engine.v4.models",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
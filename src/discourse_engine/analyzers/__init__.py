@@ -1,23 +1,21 @@
 """Modular analyzers for discourse analysis pipeline."""
 
-from discourse_engine.analyzers.base import Analyzer
-from discourse_engine.analyzers.statistics import StatisticsAnalyzer
-from discourse_engine.analyzers.trigger_profile import TriggerProfileAnalyzer
-from discourse_engine.analyzers.tone import ToneAnalyzer
-from discourse_engine.analyzers.modal_pronoun import ModalPronounAnalyzer
-from discourse_engine.analyzers.logical_fallacy import LogicalFallacyAnalyzer
-from discourse_engine.analyzers.hidden_assumptions import HiddenAssumptionExtractor
-from discourse_engine.analyzers.hidden_agenda import HiddenAgendaAnalyzer
-from discourse_engine.analyzers.satire import SatireAnalyzer
+from discourse_engine.utils.lazy import lazy_exports
 
-__all__ = [
-    "Analyzer",
-    "StatisticsAnalyzer",
-    "TriggerProfileAnalyzer",
-    "ToneAnalyzer",
-    "ModalPronounAnalyzer",
-    "LogicalFallacyAnalyzer",
-    "HiddenAssumptionExtractor",
-    "HiddenAgendaAnalyzer",
-    "SatireAnalyzer",
-]
+# Analyzer classes resolve lazily (PEP 562), so importing one analyzer module does not
+# import, load lexicons for, and compile the patterns of every other one.
+_LAZY_EXPORTS = {
+    "Analyzer": "discourse_engine.analyzers.base",
+    "StatisticsAnalyzer": "discourse_engine.analyzers.statistics",
+    "TriggerProfileAnalyzer": "discourse_engine.analyzers.trigger_profile",
+    "ToneAnalyzer": "discourse_engine.analyzers.tone",
+    "ModalPronounAnalyzer": "discourse_engine.analyzers.modal_pronoun",
+    "LogicalFallacyAnalyzer": "discourse_engine.analyzers.logical_fallacy",
+    "HiddenAssumptionExtractor": "discourse_engine.analyzers.hidden_assumptions",
+    "HiddenAgendaAnalyzer": "discourse_engine.analyzers.hidden_agenda",
+    "SatireAnalyzer": "discourse_engine.analyzers.satire",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
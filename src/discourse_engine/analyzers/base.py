@@ -1,6 +1,7 @@
 """Abstract base for pipeline analyzers."""
 
-from typing import Protocol, TypeVar
+from collections.abc import Callable, Iterable, Iterator
+from typing import Generic, Protocol, TypeVar
 
 T = TypeVar("T")
 
@@ -11,3 +12,13 @@ class Analyzer(Protocol[T]):
     def analyze(self, text: str) -> T:
         """Analyze the given text and return structured result."""
         ...
+
+
+class BatchAnalyzer(Generic[T]):
+    """Mixin giving an analyzer with analyze(text) -> T a lazy analyze_many over a stream of texts."""
+
+    analyze: Callable[[str], T]
+
+    def analyze_many(self, texts: Iterable[str]) -> Iterator[T]:
+        """Analyze a stream of texts lazily, yielding one analyze() result per text in order."""
+        return map(self.analyze, texts)
@@ -2,24 +2,26 @@
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from discourse_engine.models.report import AgendaFlag
+from discourse_engine.utils.patterns import RuleScanner, fold_pattern
 from discourse_engine.utils.text_utils import (
     sentence_containing_offset,
-    split_sentences,
     split_sentences_with_offsets,
 )
 
 
-def _load_lexicon(lexicon_dir: Path, name: str) -> list[str]:
-    """Load a JSON lexicon file."""
+@lru_cache(maxsize=32)
+def _load_lexicon(lexicon_dir: Path, name: str) -> tuple[str, ...]:
+    """Load a JSON lexicon file (cached per directory and name; immutable)."""
     path = lexicon_dir / f"{name}.json"
     if not path.exists():
-        return []
+        return ()
     with open(path, encoding="utf-8") as f:
         data = json.load(f)
-    return data if isinstance(data, list) else []
+    return tuple(data) if isinstance(data, list) else ()
 
 
 # ---------------------------------------------------------------------------
@@ -34,9 +36,10 @@ WHATABOUTISM_PATTERNS = (
 )
 
 # Shifting goalpost: "This is not X, this is Y"
+# Optional words are atomic and bounded, so a failed attempt cannot re-split them
 SHIFTING_GOALPOST_PATTERNS = (
-    re.compile(r"\bthis\s+is\s+not\s+(?:\w+\s+)?(?:,\s*)?(?:it['\u2019]?s\s+)?(?:a\s+)?\w+", re.IGNORECASE),
-    re.compile(r"\bthat['\u2019]?s\s+not\s+\w+[,.]\s*(?:it['\u2019]?s|that['\u2019]?s)\s+", re.IGNORECASE),
+    re.compile(r"\bthis\s+is\s+not\s+(?>\w{1,30}\s+)?(?>,\s*)?(?>it['\u2019]?s\s+)?(?>a\s+)?\w{1,30}", re.IGNORECASE),
+    re.compile(r"\bthat['\u2019]?s\s+not\s+\w{1,30}[,.]\s*(?:it['\u2019]?s|that['\u2019]?s)\s+", re.IGNORECASE),
 )
 
 # Side note / diversion: "Meanwhile" introducing unrelated or tangentially related content
@@ -57,6 +60,7 @@ US_VS_THEM_PRONOUN_PATTERN = re.compile(
     r"\b(?:they|them|their)\s+(?:want|are|will|have|had)\s+",
     re.IGNORECASE,
 )
+_WORD_RE = re.compile(r"\b\w+\b")
 IN_GROUP_PRONOUNS = frozenset({"we", "us", "our"})
 ABSTRACT_ANAPHOR_NOUNS = frozenset({
     "traditions", "reforms", "policies", "developments", "institutions",
@@ -69,6 +73,23 @@ US_VS_THEM_HOSTILE = frozenset({
     "poisoning", "enemy", "enemies", "invaders", "infest",
 })
 
+
+@lru_cache(maxsize=32)
+def _compile_terms(terms: frozenset[str] | tuple[str, ...]) -> re.Pattern:
+    """Compile literal terms into one case-insensitive alternation (substring semantics)."""
+    # Longest first so a term is never shadowed by one of its own prefixes
+    return re.compile("|".join(re.escape(t) for t in sorted(set(terms), key=len, reverse=True)), re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _compile_lower_terms(terms: frozenset[str] | tuple[str, ...]) -> re.Pattern:
+    """Case-sensitive twin of _compile_terms(terms), for searching already-lowercased text."""
+    return fold_pattern(_compile_terms(terms))
+
+
+_HOSTILE_RE = _compile_terms(US_VS_THEM_HOSTILE)
+_HOSTILE_LOWER_RE = _compile_lower_terms(US_VS_THEM_HOSTILE)
+
 # Gatekeeping: "real", "true", "only genuine", "the only real"
 GATEKEEPING_PATTERNS = (
     re.compile(r"\b(?:the\s+)?only\s+real\s+\w+", re.IGNORECASE),
@@ -141,6 +162,17 @@ DEFAULT_VALUE_TERMS = [
     "innovation", "efficiency", "stability", "integrity", "freedom", "progress", "reform",
 ]
 
+# Prescriptive: should, must, need to, recommend, requires — advocating action
+# Descriptive: divides, characterizes, describes, often — meta-analysis of discourse
+PRESCRIPTIVE_MARKERS = re.compile(
+    r"\b(?:should|must|need\s+to|requires?|recommend|prioritize|ensure|will\s+encourage|encourage)\b",
+    re.IGNORECASE,
+)
+DESCRIPTIVE_MARKERS = re.compile(
+    r"\b(?:divides?|characterizes?|describes?|often|typically|frequently|tends?\s+to)\b",
+    re.IGNORECASE,
+)
+
 # ---------------------------------------------------------------------------
 # Obscuration: corporate euphemisms that mask real-world actions (high confidence)
 # ---------------------------------------------------------------------------
@@ -167,6 +199,80 @@ MANDATORY_CONSENSUS_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# ---------------------------------------------------------------------------
+# Agenda techniques, in report order:
+#   (family, technique, pattern_hint, confidence, patterns, canaries)
+# Each technique is flagged at most once. Rules with no patterns are lexicon- or
+# sentence-driven and matched separately in analyze(). Canaries are lowercase literals
+# every match contains; when none is in the text the patterns are not run at all.
+# ---------------------------------------------------------------------------
+_AGENDA_RULES = (
+    ("Topic deflection", "Counter-accusation",
+     "counter-accusation or deflection ('what about', 'how about')", 0.82, WHATABOUTISM_PATTERNS,
+     ("about",)),
+    ("Topic deflection", "Scope redefinition",
+     "relativizing by redefining ('this is not X, it's Y')", 0.75, SHIFTING_GOALPOST_PATTERNS,
+     ("not",)),
+    ("Topic deflection", "Topic diversion",
+     "diversion or tangential insertion ('Meanwhile', 'In other news')", 0.72, SIDE_NOTE_PATTERNS,
+     ("meanwhile", "news")),
+    ("In-group/out-group framing", "Pronoun contrast",
+     "pronoun polarization ('they want', 'they are') with we/us contrast", 0.72, (US_VS_THEM_PRONOUN_PATTERN,),
+     ("they", "them", "their")),
+    ("In-group/out-group framing", "Hostile out-group language",
+     "dehumanizing or hostile out-group language", 0.78, (), ()),
+    ("In-group/out-group framing", "Boundary definition",
+     "defining who 'truly' belongs ('only real', 'true patriots')", 0.70, GATEKEEPING_PATTERNS,
+     ("real", "true", "genuine")),
+    ("Unsupported claim", "Speculative framing",
+     "speculative or unconfirmed framing ('rumors', 'allegedly')", 0.80, SPECULATION_PATTERNS,
+     ("rumor", "allegedly", "reportedly", "been")),
+    ("Unsupported claim", "Vague authority",
+     "vague authority without specification", 0.68, VAGUENESS_AGENDA_PATTERNS,
+     ("expert", "stud", "many")),
+    ("Personal attack", "Derogatory framing",
+     "personal attack or derogatory framing", 0.74, MUD_HONEY_PATTERNS,
+     ("hypocrite", "liar", "crook", "fraud", "bedraggled", "terrifying")),
+    ("Emotional intensity", "Fear/threat framing",
+     "fear or threat language", 0.62, (), ()),
+    ("Face-threatening act", "Negative politeness threat",
+     "polite phrasing masking blame ('I'm sure you wouldn't want to...', 'We'd hate for you to...')",
+     0.80, FACE_THREATENING_PATTERNS, ("sure", "hate")),
+    ("Coerced consensus", "Mandatory participation framing",
+     "mandatory + abstract virtue (loyalty, values, togetherness)", 0.82, (MANDATORY_CONSENSUS_PATTERN,),
+     ("mandatory",)),
+    *(
+        ("Obscuration", technique, f"obscuring jargon: likely {real_action}", conf, (pat,), canaries)
+        for (pat, technique, real_action, conf), canaries in zip(OBSCURATION_PATTERNS, (
+            ("right-sizing", "decoupling", "harmonization"),
+            ("capital", "talent-pool"),
+            ("bandwidth", "availability", "synergy"),
+            ("marketplace",),
+        ))
+    ),
+    ("Normative directive", "Prescriptive framing",
+     "policy advocacy verb + value term (prescriptive)", 0.72, (), ()),
+    ("Normative directive", "Problem-solution structure",
+     "triadic structure: problem -> solution -> justification", 0.68, (), ()),
+)
+_RULE_PRONOUN_CONTRAST = 3
+_RULE_HOSTILE = 4
+_RULE_FEAR = 9
+_RULE_PRESCRIPTIVE = len(_AGENDA_RULES) - 2
+_RULE_PROBLEM_SOLUTION = len(_AGENDA_RULES) - 1
+
+# Case-sensitive twins of the per-sentence markers, matched against lowercased sentences
+_PRESCRIPTIVE_LOWER = fold_pattern(PRESCRIPTIVE_MARKERS)
+_DESCRIPTIVE_LOWER = fold_pattern(DESCRIPTIVE_MARKERS)
+_PROBLEM_LOWER = tuple(fold_pattern(p) for p in PROBLEM_PATTERNS)
+_JUSTIFICATION_LOWER = tuple(fold_pattern(p) for p in JUSTIFICATION_PATTERNS)
+
+# Scanner over every pattern-based rule, giving each rule its earliest match offset
+_AGENDA_SCANNER = RuleScanner(
+    (i, pats, canaries) for i, (*_, pats, canaries) in enumerate(_AGENDA_RULES)
+)
+_MULTI_PATTERN_RULES = frozenset(i for i, (*_, pats, _canaries) in enumerate(_AGENDA_RULES) if len(pats) > 1)
+
 
 class HiddenAgendaAnalyzer:
     """
@@ -178,227 +284,87 @@ class HiddenAgendaAnalyzer:
         if lexicon_dir is None:
             lexicon_dir = Path(__file__).parent.parent / "lexicons"
         self.lexicon_dir = Path(lexicon_dir)
-        self._fear_terms = _load_lexicon(self.lexicon_dir, "fear_terms") or list(DEFAULT_FEAR_TERMS)
+        # Lexicons and the compiled fear matcher are cached, so new instances share them
+        self._fear_terms = _load_lexicon(self.lexicon_dir, "fear_terms") or tuple(DEFAULT_FEAR_TERMS)
+        self._fear_re = _compile_terms(self._fear_terms)
+        self._fear_lower_re = _compile_lower_terms(self._fear_terms)
         self._policy_verbs = _load_lexicon(self.lexicon_dir, "policy_advocacy_verbs") or DEFAULT_POLICY_VERBS
         self._value_terms = _load_lexicon(self.lexicon_dir, "value_terms") or DEFAULT_VALUE_TERMS
-
-    def analyze(self, text: str) -> list[AgendaFlag]:
-        """Return list of AgendaFlag for detected agenda techniques."""
+        self._policy_set = frozenset(v.lower() for v in self._policy_verbs)
+        self._value_set = frozenset(v.lower() for v in self._value_terms)
+
+    def analyze(
+        self,
+        text: str,
+        *,
+        lower: str | None = None,
+        sentences_with_offsets: list[tuple[str, int, int]] | None = None,
+    ) -> list[AgendaFlag]:
+        """
+        Return list of AgendaFlag for detected agenda techniques.
+        A caller that already holds text.lower() or split_sentences_with_offsets(text) can pass
+        them as lower and sentences_with_offsets.
+        """
         if not text or not text.strip():
             return []
 
-        flags: list[AgendaFlag] = []
-        lower = text.lower()
-        sentences_with_offsets = split_sentences_with_offsets(text)
-
-        def _sentence_at(match: re.Match) -> str:
-            return sentence_containing_offset(sentences_with_offsets, match.start())
-
-        def _sentence_for_term(term: str) -> str:
-            m = re.search(rf"\b{re.escape(term)}\b", text, re.IGNORECASE)
-            return _sentence_at(m) if m else (sentences_with_offsets[0][0] if sentences_with_offsets else "")
-
-        # Topic deflection (neutral terminology)
-        for pat in WHATABOUTISM_PATTERNS:
-            m = pat.search(text)
-            if m:
-                flags.append(AgendaFlag(
-                    family="Topic deflection",
-                    technique="Counter-accusation",
-                    pattern_hint="counter-accusation or deflection ('what about', 'how about')",
-                    sentence=_sentence_at(m),
-                    confidence=0.82,
-                ))
-                break
-
-        for pat in SHIFTING_GOALPOST_PATTERNS:
-            m = pat.search(text)
-            if m:
-                flags.append(AgendaFlag(
-                    family="Topic deflection",
-                    technique="Scope redefinition",
-                    pattern_hint="relativizing by redefining ('this is not X, it's Y')",
-                    sentence=_sentence_at(m),
-                    confidence=0.75,
-                ))
-                break
-
-        for pat in SIDE_NOTE_PATTERNS:
-            m = pat.search(text)
-            if m:
-                flags.append(AgendaFlag(
-                    family="Topic deflection",
-                    technique="Topic diversion",
-                    pattern_hint="diversion or tangential insertion ('Meanwhile', 'In other news')",
-                    sentence=_sentence_at(m),
-                    confidence=0.72,
-                ))
-                break
-
-        # In-group/out-group framing (neutral terminology)
-        m = US_VS_THEM_PRONOUN_PATTERN.search(text)
-        if m:
-            sent = _sentence_at(m)
-            sent_lower = sent.lower()
-            sent_words = set(re.findall(r"\b\w+\b", sent_lower))
-            has_in_group = bool(sent_words & IN_GROUP_PRONOUNS)
-            if has_in_group:
-                flags.append(AgendaFlag(
-                    family="In-group/out-group framing",
-                    technique="Pronoun contrast",
-                    pattern_hint="pronoun polarization ('they want', 'they are') with we/us contrast",
-                    sentence=sent,
-                    confidence=0.72,
-                ))
-
-        for w in US_VS_THEM_HOSTILE:
-            if w in lower:
-                flags.append(AgendaFlag(
-                    family="In-group/out-group framing",
-                    technique="Hostile out-group language",
-                    pattern_hint="dehumanizing or hostile out-group language",
-                    sentence=_sentence_for_term(w),
-                    confidence=0.78,
-                ))
-                break
-
-        for pat in GATEKEEPING_PATTERNS:
-            m = pat.search(text)
-            if m:
-                flags.append(AgendaFlag(
-                    family="In-group/out-group framing",
-                    technique="Boundary definition",
-                    pattern_hint="defining who 'truly' belongs ('only real', 'true patriots')",
-                    sentence=_sentence_at(m),
-                    confidence=0.70,
-                ))
-                break
-
-        # Unsupported claim
-        for pat in SPECULATION_PATTERNS:
-            m = pat.search(text)
-            if m:
-                flags.append(AgendaFlag(
-                    family="Unsupported claim",
-                    technique="Speculative framing",
-                    pattern_hint="speculative or unconfirmed framing ('rumors', 'allegedly')",
-                    sentence=_sentence_at(m),
-                    confidence=0.80,
-                ))
-                break
-
-        for pat in VAGUENESS_AGENDA_PATTERNS:
-            m = pat.search(text)
-            if m:
-                flags.append(AgendaFlag(
-                    family="Unsupported claim",
-                    technique="Vague authority",
-                    pattern_hint="vague authority without specification",
-                    sentence=_sentence_at(m),
-                    confidence=0.68,
-                ))
-                break
-
-        # Personal attack
-        for pat in MUD_HONEY_PATTERNS:
-            m = pat.search(text)
-            if m:
-                flags.append(AgendaFlag(
-                    family="Personal attack",
-                    technique="Derogatory framing",
-                    pattern_hint="personal attack or derogatory framing",
-                    sentence=_sentence_at(m),
-                    confidence=0.74,
-                ))
-                break
-
-        # Emotional intensity
-        fear_lower = [t.lower() for t in self._fear_terms]
-        for t in fear_lower:
-            if t in lower:
-                flags.append(AgendaFlag(
-                    family="Emotional intensity",
-                    technique="Fear/threat framing",
-                    pattern_hint="fear or threat language",
-                    sentence=_sentence_for_term(t),
-                    confidence=0.62,
-                ))
-                break
-
-        # Face-threatening acts: polite phrasing that masks blame or threat
-        for pat in FACE_THREATENING_PATTERNS:
-            m = pat.search(text)
+        if sentences_with_offsets is None:
+            sentences_with_offsets = split_sentences_with_offsets(text)
+
+        def _sentence_at(offset: int) -> str:
+            return sentence_containing_offset(sentences_with_offsets, offset)
+
+        # Document-level rules: the scanner gives each rule its earliest match offset.
+        # The lowercased document is shared by the scanner and the lexicon searches.
+        if lower is None:
+            lower = text.lower()
+        starts = {i: pos for i, (pos, _) in _AGENDA_SCANNER.first_matches(text, lower).items()}
+        # The scanner only says a rule matched. As in hidden_assumptions, a rule with several
+        # patterns reports the first pattern in tuple order that matches, wherever it falls.
+        for i in starts.keys() & _MULTI_PATTERN_RULES:
+            starts[i] = next((m.start() for pat in _AGENDA_RULES[i][4] if (m := pat.search(text))), starts[i])
+
+        m_start = starts.get(_RULE_PRONOUN_CONTRAST)
+        if m_start is not None:
+            sent_words = set(_WORD_RE.findall(_sentence_at(m_start).lower()))
+            if not sent_words & IN_GROUP_PRONOUNS:
+                del starts[_RULE_PRONOUN_CONTRAST]
+
+        # Lexicon rules: earliest occurrence of any term, in one pass per lexicon. The
+        # lowered view is only usable while its offsets line up with text.
+        fold = len(lower) == len(text)
+        for rule, term_re, lower_re in (
+            (_RULE_HOSTILE, _HOSTILE_RE, _HOSTILE_LOWER_RE),
+            (_RULE_FEAR, self._fear_re, self._fear_lower_re),
+        ):
+            m = lower_re.search(lower) if fold else term_re.search(text)
             if m:
-                flags.append(AgendaFlag(
-                    family="Face-threatening act",
-                    technique="Negative politeness threat",
-                    pattern_hint="polite phrasing masking blame ('I'm sure you wouldn't want to...', 'We'd hate for you to...')",
-                    sentence=_sentence_at(m),
-                    confidence=0.80,
-                ))
-                break
+                starts[rule] = m.start()
 
-        # Coerced consensus: mandatory + abstract virtue/loyalty term
-        m = MANDATORY_CONSENSUS_PATTERN.search(text)
-        if m:
-            flags.append(AgendaFlag(
-                family="Coerced consensus",
-                technique="Mandatory participation framing",
-                pattern_hint="mandatory + abstract virtue (loyalty, values, togetherness)",
-                sentence=_sentence_at(m),
-                confidence=0.82,
-            ))
-
-        # Obscuration: corporate euphemisms (high hidden-agenda confidence)
-        for pat, technique, real_action, conf in OBSCURATION_PATTERNS:
-            m = pat.search(text)
-            if m:
-                flags.append(AgendaFlag(
-                    family="Obscuration",
-                    technique=technique,
-                    pattern_hint=f"obscuring jargon: likely {real_action}",
-                    sentence=_sentence_at(m),
-                    confidence=conf,
-                ))
+        # Reported sentence per matched rule; a rule already present is never recomputed
+        found = {i: _sentence_at(pos) for i, pos in starts.items()}
 
         # Advocating (Layer 2): policy advocacy verbs + value terms
-        sentences = split_sentences(text)
-        policy_set = {v.lower() for v in self._policy_verbs}
-        value_set = {v.lower() for v in self._value_terms}
+        sentences = [s for s, _, _ in sentences_with_offsets]
+        sentences_lower = [s.lower() for s in sentences]
+        policy_set = self._policy_set
+        value_set = self._value_set
 
-        def _has_policy_verb(s: str) -> bool:
-            s_lower = s.lower()
+        def _has_policy_verb(s_lower: str) -> bool:
             return any(pv in s_lower for pv in policy_set)
 
-        def _has_value_term(s: str) -> bool:
-            words = set(re.findall(r"\b\w+\b", s.lower()))
+        def _has_value_term(s_lower: str) -> bool:
+            words = set(_WORD_RE.findall(s_lower))
             return bool(words & value_set)
 
-        # Prescriptive: should, must, need to, recommend, requires — advocating action
-        # Descriptive: divides, characterizes, describes, often — meta-analysis of discourse
-        PRESCRIPTIVE_MARKERS = re.compile(
-            r"\b(?:should|must|need\s+to|requires?|recommend|prioritize|ensure|will\s+encourage|encourage)\b",
-            re.IGNORECASE,
-        )
-        DESCRIPTIVE_MARKERS = re.compile(
-            r"\b(?:divides?|characterizes?|describes?|often|typically|frequently|tends?\s+to)\b",
-            re.IGNORECASE,
-        )
-
-        for sent in sentences:
-            has_policy = _has_policy_verb(sent)
-            has_value = _has_value_term(sent)
-            is_prescriptive = bool(PRESCRIPTIVE_MARKERS.search(sent))
-            is_descriptive = bool(DESCRIPTIVE_MARKERS.search(sent))
+        for sent, s_lower in zip(sentences, sentences_lower):
+            has_policy = _has_policy_verb(s_lower)
+            has_value = _has_value_term(s_lower)
+            is_prescriptive = bool(_PRESCRIPTIVE_LOWER.search(s_lower))
+            is_descriptive = bool(_DESCRIPTIVE_LOWER.search(s_lower))
             # Only flag when prescriptive; suppress when descriptive meta-analysis
             if has_policy and has_value and is_prescriptive and not is_descriptive:
-                flags.append(AgendaFlag(
-                    family="Normative directive",
-                    technique="Prescriptive framing",
-                    pattern_hint="policy advocacy verb + value term (prescriptive)",
-                    sentence=sent,
-                    confidence=0.72,
-                ))
+                found[_RULE_PRESCRIPTIVE] = sent
                 break
 
         # Normative directive: rhetorical flow Problem -> Solution -> Justification
@@ -406,12 +372,12 @@ class HiddenAgendaAnalyzer:
         solution_idxs: list[int] = []
         justification_idxs: list[int] = []
 
-        for i, sent in enumerate(sentences):
-            if any(pat.search(sent) for pat in PROBLEM_PATTERNS):
+        for i, s_lower in enumerate(sentences_lower):
+            if any(pat.search(s_lower) for pat in _PROBLEM_LOWER):
                 problem_idxs.append(i)
-            if _has_policy_verb(sent):
+            if _has_policy_verb(s_lower):
                 solution_idxs.append(i)
-            if any(pat.search(sent) for pat in JUSTIFICATION_PATTERNS):
+            if any(pat.search(s_lower) for pat in _JUSTIFICATION_LOWER):
                 justification_idxs.append(i)
 
         # Triadic structure: problem before solution before justification (within 2-sentence gap)
@@ -420,13 +386,7 @@ class HiddenAgendaAnalyzer:
                 if si > pi and si - pi <= 2:
                     for ji in justification_idxs:
                         if ji > si and ji - si <= 2:
-                            flags.append(AgendaFlag(
-                                family="Normative directive",
-                                technique="Problem-solution structure",
-                                pattern_hint="triadic structure: problem -> solution -> justification",
-                                sentence=sentences[si],
-                                confidence=0.68,
-                            ))
+                            found[_RULE_PROBLEM_SOLUTION] = sentences[si]
                             break
                     else:
                         continue
@@ -435,13 +395,14 @@ class HiddenAgendaAnalyzer:
                 continue
             break
 
-        # Deduplicate by (family, technique)
-        seen: set[tuple[str, str]] = set()
-        deduped: list[AgendaFlag] = []
-        for f in flags:
-            key = (f.family, f.technique)
-            if key not in seen:
-                seen.add(key)
-                deduped.append(f)
-
-        return deduped
+        return [
+            AgendaFlag(
+                family=family,
+                technique=technique,
+                pattern_hint=pattern_hint,
+                sentence=found[i],
+                confidence=confidence,
+            )
+            for i, (family, technique, pattern_hint, confidence, *_) in enumerate(_AGENDA_RULES)
+            if i in found
+        ]
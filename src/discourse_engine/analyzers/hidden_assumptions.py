@@ -1,22 +1,30 @@
 """Rule-based hidden assumption extraction."""
 
 import json
+import os
 import re
-from dataclasses import dataclass
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 
+from discourse_engine.analyzers.base import BatchAnalyzer
 from discourse_engine.models.report import AssumptionFlag
-from discourse_engine.utils.text_utils import split_sentences
+from discourse_engine.utils.cache import ResultCache
+from discourse_engine.utils.patterns import FREE_THREADED, Hits, KeywordScanner, RuleScanner
+from discourse_engine.utils.text_utils import split_sentences_with_offsets
 
 
-def _load_lexicon(lexicon_dir: Path, name: str) -> list[str]:
-    """Load a JSON lexicon file."""
+@lru_cache(maxsize=32)
+def _load_lexicon(lexicon_dir: Path, name: str) -> tuple[str, ...]:
+    """Load a JSON lexicon file (cached per directory and name; immutable)."""
     path = lexicon_dir / f"{name}.json"
     if not path.exists():
-        return []
+        return ()
     with open(path, encoding="utf-8") as f:
         data = json.load(f)
-    return data if isinstance(data, list) else []
+    return tuple(data) if isinstance(data, list) else ()
 
 # ---------------------------------------------------------------------------
 # Presupposition triggers (linguistic constructions that imply unstated beliefs)
@@ -47,6 +55,32 @@ CHANGE_OF_STATE_VERBS = frozenset({
 # Repetition/iteration: presuppose prior occurrence
 REPETITION_WORDS = frozenset({"again", "still", "return", "returned", "restore", "restored"})
 
+
+def _word_alternation(words: frozenset[str]) -> re.Pattern:
+    """Compile a word list into one case-insensitive whole-word alternation."""
+    # Longest first so the engine prefers the longest form at a given position
+    return re.compile(r"\b(?:" + "|".join(sorted(words, key=len, reverse=True)) + r")\b", re.IGNORECASE)
+
+
+FACTIVE_RE = _word_alternation(FACTIVE_VERBS)
+IMPLICATIVE_RE = _word_alternation(IMPLICATIVE_VERBS)
+CHANGE_OF_STATE_RE = _word_alternation(CHANGE_OF_STATE_VERBS)
+REPETITION_RE = _word_alternation(REPETITION_WORDS)
+
+# (pattern, description, detection_type, base confidence), one flag per category
+PRESUPPOSITION_TRIGGERS = (
+    (FACTIVE_RE, "Presupposition: treats something as already established (factive verb)",
+     "factive", 0.75),
+    (IMPLICATIVE_RE, "Presupposition: implies unstated prior action or attempt (implicative verb)",
+     "implicative", 0.65),
+    (CHANGE_OF_STATE_RE, "Presupposition: assumes a prior state (change-of-state verb)",
+     "change_of_state", 0.68),
+    (REPETITION_RE, "Presupposition: implies prior occurrence (repetition/iteration)",
+     "repetition", 0.70),
+)
+# Scanner keys of the trigger table, for a single disjointness test on hit-free sentences
+_PRESUPPOSITION_KEYS = frozenset(pattern for pattern, *_ in PRESUPPOSITION_TRIGGERS)
+
 # Epistemic shortcuts: present claim as obvious without justification
 EPISTEMIC_SHORTCUTS = frozenset({
     "obviously", "clearly", "certainly", "of course", "needless to say",
@@ -110,6 +144,16 @@ LOADED_QUESTION_PATTERNS = (
     re.compile(r"\bis\s+\w+\s+(?:really|actually)\s+(?:so|that)\s+", re.IGNORECASE),
 )
 
+
+def _union(patterns: Sequence[re.Pattern]) -> re.Pattern:
+    """One alternation of patterns in order. Its first match is the earliest match of any
+    pattern (first pattern wins ties), found in a single pass instead of one per pattern."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE)
+
+
+VAGUE_AUTHORITY_RE = _union(VAGUE_AUTHORITY_PATTERNS)
+LOADED_QUESTION_RE = _union(LOADED_QUESTION_PATTERNS)
+
 # Conditional guilt: "I'm sure you didn't mean to X" - implies fault while feigning benefit of doubt
 CONDITIONAL_GUILT_PATTERNS = (
     re.compile(r"\b(?:I['\u2019]?m|I am|we['\u2019]?re|we are)\s+(?:sure|hope|trust)\s+(?:you|they)\s+(?:didn['\u2019]?t|wouldn['\u2019]?t)\s+mean\s+to\b", re.IGNORECASE),
@@ -118,10 +162,45 @@ CONDITIONAL_GUILT_PATTERNS = (
 
 # Suggestive questioning: stacked alternatives implying negative
 SUGGESTIVE_QUESTION_PATTERN = re.compile(
-    r"\bis\s+(?:he|she|they|it)\s+(?:\w+\s+)?(?:or\s+)?(?:\w+\s+)?\?",
+    r"\bis\s+(?:he|she|they|it)\s+(?>\w{1,30}\s+)?(?>or\s+)?(?>\w{1,30}\s+)?\?",
     re.IGNORECASE,
 )
 
+# Epistemic shortcuts match as plain substrings; universal quantifiers as whole words.
+# Multi-word quantifiers ("no one") are excluded: they never matched the word-set check.
+EPISTEMIC_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(EPISTEMIC_SHORTCUTS, key=len, reverse=True)), re.IGNORECASE
+)
+# Every shortcut contains its own last word, so a document without any of them skips the scan
+_EPISTEMIC_CANARIES = tuple(sorted({p.split()[-1] for p in EPISTEMIC_SHORTCUTS}))
+_UNIVERSAL_WORDS = frozenset(w for w in UNIVERSAL_QUANTIFIERS if " " not in w)
+UNIVERSAL_RE = _word_alternation(_UNIVERSAL_WORDS)
+
+# Every sentence-level rule, keyed by its pattern(s), scanned once over the whole document.
+# Canaries (literals every match contains) let absent rules skip the scan entirely.
+_SENTENCE_SCANNER = RuleScanner(
+    [(pat, (pat,)) for pat in (META_FRAMING_SUPPRESS, CONCLUSION_MARKERS)]
+    + [
+        (EPISTEMIC_RE, (EPISTEMIC_RE,), _EPISTEMIC_CANARIES),
+        (NONE_OF_X_PATTERN, (NONE_OF_X_PATTERN,), ("none",)),
+        (SUGGESTIVE_QUESTION_PATTERN, (SUGGESTIVE_QUESTION_PATTERN,), ("?",)),
+        (VAGUE_AUTHORITY_RE, (VAGUE_AUTHORITY_RE,),
+         ("expert", "stud", "many", "people", "widely", "research")),
+        (LOADED_QUESTION_RE, (LOADED_QUESTION_RE,)),
+        (CONDITIONAL_GUILT_PATTERNS, CONDITIONAL_GUILT_PATTERNS, ("mean", "hate", "hope")),
+    ]
+)
+
+# The single-word lexicons are disjoint, so one keyword pass finds the first hit of each;
+# hits are keyed by the same patterns as above, which the checks look up
+_KEYWORD_SCANNER = KeywordScanner({
+    FACTIVE_RE: FACTIVE_VERBS,
+    IMPLICATIVE_RE: IMPLICATIVE_VERBS,
+    CHANGE_OF_STATE_RE: CHANGE_OF_STATE_VERBS,
+    REPETITION_RE: REPETITION_WORDS,
+    UNIVERSAL_RE: _UNIVERSAL_WORDS,
+})
+
 # ---------------------------------------------------------------------------
 # Structural assumption patterns (Layer 2)
 # ---------------------------------------------------------------------------
@@ -151,26 +230,57 @@ CAUSAL_LEADS_TO = re.compile(
     re.IGNORECASE,
 )
 
+# Literals at least one of which every match of the structural pattern contains; a
+# sentence whose lowercase form has none of them cannot match, so its search is skipped.
+# Unlike the lexical rules these stay per sentence: each starts with an open \w+ run or a
+# .*?, so a document-wide sweep tries nearly every word of the text, while the canaries
+# confine the search to the few sentences that can match (2-9x faster on long documents).
+_STRUCTURAL_CANARIES = {
+    NECESSITY_MODAL_OUTCOME: ("must", "need", "require", "has", "have", "should"),
+    CONDITIONAL_NECESSITY: ("if", "when"),
+    WITHOUT_X_Y: ("without",),
+    CAUSAL_LEADS_TO: ("lead", "result", "cause"),
+}
+_NECESSITY_MODAL_PHRASES = ("must", "need to", "needs to", "require", "requires", "has to", "have to", "should")
+
+
+def _search_gated(pattern: re.Pattern, sentence: str, lower: str) -> re.Match | None:
+    """Search sentence with a structural pattern unless its canaries rule a match out."""
+    if not any(c in lower for c in _STRUCTURAL_CANARIES[pattern]):
+        return None
+    return pattern.search(sentence)
+
+
+# ASCII punctuation/whitespace -> space; letters, digits and "_" survive so that
+# tokens glued to digits or underscores are dropped below, exactly as \b[a-z]+\b does
+_WORD_SPLIT_TABLE = str.maketrans({
+    c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")
+})
+
+
+_ALPHA_WORD_RE = re.compile(r"\b[a-z]+\b")
+_WORD_RE = re.compile(r"\b\w+\b")
+_DENSITY_SIGNAL_RE = re.compile(r"\b(must|should|require|therefore|obviously|everyone|nobody)\b")
 
-def _get_words_lower(text: str) -> set[str]:
-    """Return set of lowercased words in text."""
-    return set(re.findall(r"\b[a-z]+\b", text.lower()))
+
+def _get_words_lower(lower: str) -> set[str]:
+    """Return set of words in already-lowercased text."""
+    if not lower.isascii():
+        return set(_ALPHA_WORD_RE.findall(lower))
+    return {w for w in lower.translate(_WORD_SPLIT_TABLE).split() if w.isalpha()}
 
 
 HEDGING_WORDS = frozenset({"perhaps", "maybe", "might", "could", "possibly", "sometimes", "allegedly"})
 
 
-def _hedging_penalty(sentence: str) -> float:
-    """Reduce confidence if sentence contains hedging (0 or 0.1)."""
-    lower = sentence.lower()
-    words = set(re.findall(r"\b\w+\b", lower))
-    return 0.1 if (words & HEDGING_WORDS) else 0.0
+def _hedging_penalty(words: set[str]) -> float:
+    """Reduce confidence if sentence words contain hedging (0 or 0.1)."""
+    return 0.0 if HEDGING_WORDS.isdisjoint(words) else 0.1
 
 
-def _compute_density_factor(text: str) -> float:
+def _compute_density_factor(text: str, lower: str) -> float:
     """Return 0.95--1.05 multiplier: more rhetorical signals -> higher confidence."""
-    lower = text.lower()
-    signals = sum(1 for _ in re.finditer(r"\b(must|should|require|therefore|obviously|everyone|nobody)\b", lower))
+    signals = sum(1 for _ in _DENSITY_SIGNAL_RE.finditer(lower))
     word_count = max(1, len(text.split()))
     # 1+ signal per 50 words -> small boost
     density = signals / (word_count / 50)
@@ -188,10 +298,18 @@ def _apply_suppressions(base_conf: float, sentence: str, density_factor: float)
     conf = base_conf * density_factor
     if META_DISCUSSION_PATTERN.search(sentence):
         conf *= 0.5  # meta-discussion about a word, not use of it
-    return max(0.0, min(0.95, conf))
+    # Chained comparisons instead of max/min calls; NaN still clamps to 0.95 as before
+    return conf if 0.0 <= conf <= 0.95 else (0.0 if conf < 0.0 else 0.95)
+
+
+@lru_cache(maxsize=None)
+def _normative_weight(description: str) -> float:
+    """Normative component for calibrated scoring (descriptions come from a fixed set)."""
+    lower = description.lower()
+    return 0.6 if ("value" in lower or "necessity" in lower or "necessary" in lower) else 0.3
 
 
-@dataclass
+@dataclass(slots=True)
 class _AssumptionMatch:
     """Internal: Layer A structural detection with type for calibrated scoring."""
 
@@ -202,238 +320,210 @@ class _AssumptionMatch:
     raw_confidence: float  # Legacy; superseded by calibrated score
 
 
-def _check_presupposition_triggers(sentence: str) -> list[_AssumptionMatch]:
-    """Check for presupposition-triggering language."""
-    matches: list[_AssumptionMatch] = []
-    lower = sentence.lower()
-    words = _get_words_lower(sentence)
+@dataclass(slots=True)
+class _SentenceView:
+    """Internal: one sentence with the lowered text, tokens, scanner hits and hedging
+    penalty computed once and shared by every check."""
 
-    base = 0.75 - _hedging_penalty(sentence)
-    for w in FACTIVE_VERBS:
-        if w in words or f"{w}s " in lower or f" {w} " in lower or f" {w}ed " in lower:
-            matches.append(_AssumptionMatch(
-                "Presupposition: treats something as already established (factive verb)",
-                w, sentence, "factive", base,
-            ))
-            break
+    sentence: str
+    lower: str
+    words: set[str]
+    hits: Hits
+    hedging: float
 
-    base = 0.65 - _hedging_penalty(sentence)
-    for w in IMPLICATIVE_VERBS:
-        if w in words:
-            matches.append(_AssumptionMatch(
-                "Presupposition: implies unstated prior action or attempt (implicative verb)",
-                w, sentence, "implicative", base,
-            ))
-            break
 
-    base = 0.68 - _hedging_penalty(sentence)
-    for w in CHANGE_OF_STATE_VERBS:
-        if w in words:
-            matches.append(_AssumptionMatch(
-                "Presupposition: assumes a prior state (change-of-state verb)",
-                w, sentence, "change_of_state", base,
-            ))
-            break
+def _check_presupposition_triggers(view: _SentenceView) -> list[_AssumptionMatch]:
+    """Check for presupposition-triggering language."""
+    matches: list[_AssumptionMatch] = []
+    if _PRESUPPOSITION_KEYS.isdisjoint(view.hits):
+        return matches
 
-    base = 0.70 - _hedging_penalty(sentence)
-    for w in REPETITION_WORDS:
-        if re.search(rf"\b{w}\b", lower):
+    for pattern, description, detection_type, base in PRESUPPOSITION_TRIGGERS:
+        if pattern in view.hits:
             matches.append(_AssumptionMatch(
-                "Presupposition: implies prior occurrence (repetition/iteration)",
-                w, sentence, "repetition", base,
+                description, view.hits[pattern][1].lower(), view.sentence, detection_type, base - view.hedging,
             ))
-            break
 
     return matches
 
 
-def _check_epistemic_shortcuts(sentence: str) -> list[_AssumptionMatch]:
+def _check_epistemic_shortcuts(view: _SentenceView) -> list[_AssumptionMatch]:
     """Check for epistemic shortcuts (obviously, clearly, etc.)."""
     matches: list[_AssumptionMatch] = []
-    lower = sentence.lower()
 
-    base = 0.80 - _hedging_penalty(sentence)
-    for phrase in EPISTEMIC_SHORTCUTS:
-        if phrase in lower:
-            matches.append(_AssumptionMatch(
-                "Presents claim as obvious without justification (epistemic shortcut)",
-                phrase, sentence, "epistemic_shortcut", base,
-            ))
-            break
+    base = 0.80 - view.hedging
+    if EPISTEMIC_RE in view.hits:
+        matches.append(_AssumptionMatch(
+            "Presents claim as obvious without justification (epistemic shortcut)",
+            view.hits[EPISTEMIC_RE][1].lower(), view.sentence, "epistemic_shortcut", base,
+        ))
 
     return matches
 
 
-def _check_universal_quantifiers(sentence: str) -> list[_AssumptionMatch]:
+def _check_universal_quantifiers(view: _SentenceView) -> list[_AssumptionMatch]:
     """Check for universal quantifiers implying blanket claims.
     Uses pattern-based 'None of X are Y' instead of bare 'none' keyword to reduce false positives.
     Suppresses meta-framing (e.g. 'presented as') where author clarifies scope, not asserting."""
     matches: list[_AssumptionMatch] = []
-    words = _get_words_lower(sentence)
-    lower = sentence.lower()
 
-    base = 0.55 - _hedging_penalty(sentence)
-    for w in UNIVERSAL_QUANTIFIERS:
-        if w in words:
-            matches.append(_AssumptionMatch(
-                "Unstated universal claim: implies shared belief or blanket generalization",
-                w, sentence, "universal", base,
-            ))
-            return matches
+    base = 0.55 - view.hedging
+    if UNIVERSAL_RE in view.hits:
+        matches.append(_AssumptionMatch(
+            "Unstated universal claim: implies shared belief or blanket generalization",
+            view.hits[UNIVERSAL_RE][1].lower(), view.sentence, "universal", base,
+        ))
+        return matches
 
     # Pattern-based: "None of X are Y" - only when substantive (not meta-framing)
-    if NONE_OF_X_PATTERN.search(sentence) and not META_FRAMING_SUPPRESS.search(sentence):
-        base = 0.62 - _hedging_penalty(sentence)
+    if NONE_OF_X_PATTERN in view.hits and META_FRAMING_SUPPRESS not in view.hits:
+        base = 0.62 - view.hedging
         matches.append(_AssumptionMatch(
             "Unstated universal claim: universal negation over set (None of X are Y)",
-            "none of X are Y", sentence, "universal", base,
+            "none of X are Y", view.sentence, "universal", base,
         ))
 
     return matches
 
 
-def _check_vague_authority(sentence: str) -> list[_AssumptionMatch]:
+def _check_vague_authority(view: _SentenceView) -> list[_AssumptionMatch]:
     """Check for vague authority without specification."""
     matches: list[_AssumptionMatch] = []
-    base = 0.65 - _hedging_penalty(sentence)
-    for pat in VAGUE_AUTHORITY_PATTERNS:
-        m = pat.search(sentence)
-        if m:
-            matches.append(_AssumptionMatch(
-                "Vague authority invoked without specification",
-                m.group(0)[:30], sentence, "vague_authority", base,
-            ))
-            break
+    base = 0.65 - view.hedging
+    if VAGUE_AUTHORITY_RE in view.hits:
+        # The union only says some pattern matched; the trigger comes from the first pattern in
+        # list order, so "Many people say experts agree" cites "experts", not "Many people"
+        for pat in VAGUE_AUTHORITY_PATTERNS:
+            m = pat.search(view.sentence)
+            if m:
+                matches.append(_AssumptionMatch(
+                    "Vague authority invoked without specification",
+                    m.group(0)[:30], view.sentence, "vague_authority", base,
+                ))
+                break
     return matches
 
 
-def _check_conclusion_markers(sentence: str) -> list[_AssumptionMatch]:
+def _check_conclusion_markers(view: _SentenceView) -> list[_AssumptionMatch]:
     """Check for conclusion markers (enthymeme). 'Therefore/thus' = higher conf than 'so'."""
     matches: list[_AssumptionMatch] = []
-    m = CONCLUSION_MARKERS.search(sentence)
-    if m:
-        marker = m.group(1).lower()
+    if CONCLUSION_MARKERS in view.hits:
+        trigger = view.hits[CONCLUSION_MARKERS][1]
+        marker = trigger.lower()
         base = 0.70 if marker in ("therefore", "thus", "hence") else 0.55
-        base -= _hedging_penalty(sentence)
+        base -= view.hedging
         matches.append(_AssumptionMatch(
             "Conclusion marker suggests inference without full stated premises (enthymeme)",
-            m.group(1), sentence, "conclusion_marker", base,
+            trigger, view.sentence, "conclusion_marker", base,
         ))
     return matches
 
 
-def _check_loaded_questions(sentence: str) -> list[_AssumptionMatch]:
+def _check_loaded_questions(view: _SentenceView) -> list[_AssumptionMatch]:
     """Check for loaded or suggestive questions."""
     matches: list[_AssumptionMatch] = []
-    if "?" not in sentence:
+    if "?" not in view.sentence:
         return matches
 
-    base = 0.85 - _hedging_penalty(sentence)
-    for pat in LOADED_QUESTION_PATTERNS:
-        if pat.search(sentence):
-            matches.append(_AssumptionMatch(
-                "Loaded question: implies an assumption in the question itself",
-                None, sentence, "loaded_question", base,
-            ))
-            return matches
+    base = 0.85 - view.hedging
+    if LOADED_QUESTION_RE in view.hits:
+        matches.append(_AssumptionMatch(
+            "Loaded question: implies an assumption in the question itself",
+            None, view.sentence, "loaded_question", base,
+        ))
+        return matches
 
-    base = 0.75 - _hedging_penalty(sentence)
-    if SUGGESTIVE_QUESTION_PATTERN.search(sentence):
+    base = 0.75 - view.hedging
+    if SUGGESTIVE_QUESTION_PATTERN in view.hits:
         matches.append(_AssumptionMatch(
             "Suggestive question: stacked alternatives implying negative traits",
-            None, sentence, "loaded_question", base,
+            None, view.sentence, "loaded_question", base,
         ))
 
     return matches
 
 
-def _check_conditional_guilt(sentence: str) -> list[_AssumptionMatch]:
+def _check_conditional_guilt(view: _SentenceView) -> list[_AssumptionMatch]:
     """Check for conditional guilt framing: 'I'm sure you didn't mean to...'"""
     matches: list[_AssumptionMatch] = []
-    base = 0.78 - _hedging_penalty(sentence)
-    for pat in CONDITIONAL_GUILT_PATTERNS:
-        if pat.search(sentence):
-            matches.append(_AssumptionMatch(
-                "Conditional guilt: implies fault while feigning benefit of doubt",
-                "I'm sure you didn't mean / I'd hate for / let's hope",
-                sentence,
-                "conditional_guilt",
-                base,
-            ))
-            return matches
+    base = 0.78 - view.hedging
+    if CONDITIONAL_GUILT_PATTERNS in view.hits:
+        matches.append(_AssumptionMatch(
+            "Conditional guilt: implies fault while feigning benefit of doubt",
+            "I'm sure you didn't mean / I'd hate for / let's hope",
+            view.sentence,
+            "conditional_guilt",
+            base,
+        ))
     return matches
 
 
 def _check_structural_assumptions(
-    sentence: str,
-    value_outcomes: list[str],
-    necessity_modals: list[str],
+    view: _SentenceView,
+    value_outcomes: frozenset[str],
+    necessity_modals: Sequence[str],
 ) -> list[_AssumptionMatch]:
     """Check for structural patterns that imply unstated premises (Layer 2)."""
     matches: list[_AssumptionMatch] = []
-    lower = sentence.lower()
-    words = _get_words_lower(sentence)
 
     # Necessity modal + outcome: "X must adapt to survive" -> "Adaptation is necessary for survival"
-    m = NECESSITY_MODAL_OUTCOME.search(sentence)
+    m = _search_gated(NECESSITY_MODAL_OUTCOME, view.sentence, view.lower)
     if m:
-        base = 0.72 - _hedging_penalty(sentence)
+        base = 0.72 - view.hedging
         matches.append(_AssumptionMatch(
             "Structural: Action is necessary for Outcome (necessity modal + outcome)",
             f"'{m.group(2)}' for '{m.group(3)}'",
-            sentence,
+            view.sentence,
             "necessity_modal_outcome",
             base,
         ))
 
     # Conditional necessity: "If X, we must Y"
-    if CONDITIONAL_NECESSITY.search(sentence):
-        base = 0.68 - _hedging_penalty(sentence)
+    if _search_gated(CONDITIONAL_NECESSITY, view.sentence, view.lower):
+        base = 0.68 - view.hedging
         matches.append(_AssumptionMatch(
             "Structural: Condition implies necessity of consequence",
             "if/when ... must/need to/should",
-            sentence,
+            view.sentence,
             "necessity_modal_outcome",
             base,
         ))
 
     # Without X, Y: "Without reform, collapse is inevitable"
-    m = WITHOUT_X_Y.search(sentence)
+    m = _search_gated(WITHOUT_X_Y, view.sentence, view.lower)
     if m:
-        base = 0.70 - _hedging_penalty(sentence)
+        base = 0.70 - view.hedging
         matches.append(_AssumptionMatch(
             "Structural: X is necessary for avoiding Y",
             f"{m.group(1).strip()} -> {m.group(2)}",
-            sentence,
+            view.sentence,
             "without_x_y",
             base,
         ))
 
     # Value-loaded outcome: sentence has outcome term + necessity modal
-    value_set = {v.lower() for v in value_outcomes}
-    modal_phrases = ["must", "need to", "needs to", "require", "requires", "has to", "have to", "should"]
-    has_modal = any(ph in lower for ph in modal_phrases)
-    has_value_outcome = bool(words & value_set)
+    has_modal = any(ph in view.lower for ph in _NECESSITY_MODAL_PHRASES)
+    has_value_outcome = not value_outcomes.isdisjoint(view.words)
     if has_modal and has_value_outcome:
         # Avoid duplicate if we already matched necessity modal + outcome
         if not matches:
-            base = 0.60 - _hedging_penalty(sentence)
+            base = 0.60 - view.hedging
             matches.append(_AssumptionMatch(
                 "Structural: Outcome is desirable/necessary (value-loaded framing)",
                 "value outcome + necessity modal",
-                sentence,
+                view.sentence,
                 "value_loaded",
                 base,
             ))
 
     # Causal claim: X leads to/results in/causes Y - causation assumed, not proven
-    m = CAUSAL_LEADS_TO.search(sentence)
+    m = _search_gated(CAUSAL_LEADS_TO, view.sentence, view.lower)
     if m:
-        base = 0.58 - _hedging_penalty(sentence)
+        base = 0.58 - view.hedging
         matches.append(_AssumptionMatch(
             "Causal claim: X -> Y asserted; causation may be assumed rather than proven",
             f"{m.group(1).strip()} -> {m.group(2).strip()}",
-            sentence,
+            view.sentence,
             "causal",
             base,
         ))
@@ -441,12 +531,42 @@ def _check_structural_assumptions(
     return matches
 
 
+# Scanner-driven checks, run in this order on every sentence with at least one hit
+_LEXICAL_CHECKS = (
+    _check_presupposition_triggers,
+    _check_epistemic_shortcuts,
+    _check_universal_quantifiers,
+    _check_vague_authority,
+    _check_conclusion_markers,
+    _check_loaded_questions,
+    _check_conditional_guilt,
+)
+
+
 # Default value outcomes if lexicon missing
 DEFAULT_VALUE_OUTCOMES = ["survival", "progress", "collapse", "excellence", "integrity", "stability", "innovation", "efficiency"]
 DEFAULT_NECESSITY_MODALS = ["must", "need to", "needs to", "require", "requires", "has to", "have to", "should"]
 
 
-class HiddenAssumptionExtractor:
+# Free-threaded builds only (sre holds the GIL otherwise): documents with at least this many
+# sentences are checked in batches of SENTENCE_BATCH_SIZE across a thread pool
+PARALLEL_MIN_SENTENCES = 32
+SENTENCE_BATCH_SIZE = 16
+
+
+def _scan_segments(text: str, segments: list[tuple[int, int]], lower: str | None = None) -> list[Hits]:
+    """Rule and keyword hits per segment of text, merged into one dict per segment."""
+    sentence_hits = _SENTENCE_SCANNER.first_matches_by_segment(text, segments, lower)
+    keyword_hits = _KEYWORD_SCANNER.first_matches_by_segment(text, segments, lower)
+    for hits, keywords in zip(sentence_hits, keyword_hits):
+        hits.update(keywords)
+    return sentence_hits
+
+
+_RESULTS: ResultCache[list[AssumptionFlag]] = ResultCache(lambda flags: [replace(f) for f in flags])
+
+
+class HiddenAssumptionExtractor(BatchAnalyzer[list[AssumptionFlag]]):
     """
     Extracts hidden assumptions via rule-based pattern matching.
     Detects presuppositions, enthymemes, epistemic shortcuts, loaded questions,
@@ -470,31 +590,95 @@ class HiddenAssumptionExtractor:
         self.lexicon_dir = Path(lexicon_dir)
         self._value_outcomes = _load_lexicon(self.lexicon_dir, "value_outcomes") or DEFAULT_VALUE_OUTCOMES
         self._necessity_modals = _load_lexicon(self.lexicon_dir, "necessity_modals") or DEFAULT_NECESSITY_MODALS
+        self._value_outcome_set = frozenset(v.lower() for v in self._value_outcomes)
+        # Results depend only on the text and these lexicons
+        self._cache_config = (self._value_outcome_set, tuple(self._necessity_modals))
+
+    def _sentence_matches(self, pairs: Sequence[tuple[str, Hits]]) -> list[_AssumptionMatch]:
+        """Run every check on each (sentence, scanner hits) pair, in order."""
+        matches: list[_AssumptionMatch] = []
+        for sentence, hits in pairs:
+            # Lowercase, tokenize and score hedging once; every check reads the same view
+            lower = sentence.lower()
+            words = _get_words_lower(lower)
+            view = _SentenceView(sentence, lower, words, hits, _hedging_penalty(words))
+            if hits:
+                # The lexical checks only read scanner hits; sentences without any skip them
+                for check in _LEXICAL_CHECKS:
+                    matches.extend(check(view))
+            matches.extend(_check_structural_assumptions(view, self._value_outcome_set, self._necessity_modals))
+        return matches
 
-    def analyze(self, text: str) -> list[AssumptionFlag]:
+    def analyze(
+        self,
+        text: str,
+        *,
+        lower: str | None = None,
+        sentences_with_offsets: list[tuple[str, int, int]] | None = None,
+    ) -> list[AssumptionFlag]:
         """
         Extract hidden assumptions from text using rule-based patterns.
         Returns a list of AssumptionFlag with description and source sentence.
+        lower and sentences_with_offsets are text.lower() and split_sentences_with_offsets(text),
+        for callers that computed them already.
         """
+        return _RESULTS.get(
+            self._cache_config, text, lambda: self._analyze(text, lower, sentences_with_offsets)
+        )
+
+    def _analyze(
+        self,
+        text: str,
+        lower: str | None = None,
+        sentences_with_offsets: list[tuple[str, int, int]] | None = None,
+    ) -> list[AssumptionFlag]:
         if not text or not text.strip():
             return []
 
-        sentences = split_sentences(text)
-        all_matches: list[_AssumptionMatch] = []
-
-        for sentence in sentences:
-            all_matches.extend(_check_presupposition_triggers(sentence))
-            all_matches.extend(_check_epistemic_shortcuts(sentence))
-            all_matches.extend(_check_universal_quantifiers(sentence))
-            all_matches.extend(_check_vague_authority(sentence))
-            all_matches.extend(_check_conclusion_markers(sentence))
-            all_matches.extend(_check_loaded_questions(sentence))
-            all_matches.extend(_check_conditional_guilt(sentence))
-            all_matches.extend(
-                _check_structural_assumptions(
-                    sentence, self._value_outcomes, self._necessity_modals
-                )
-            )
+        if sentences_with_offsets is None:
+            sentences_with_offsets = split_sentences_with_offsets(text)
+        sentences = [s for s, _, _ in sentences_with_offsets]
+
+        # Lowercase the document once for the scanner and the density signals; hits are
+        # resolved to their sentence by offset. Only spans holding exactly their sentence can
+        # be scanned in place: a merged abbreviation fragment ("... 3 p.m.") keeps a span over
+        # text the splitter dropped from the sentence, so such sentences are scanned alone.
+        text_lower = text.lower() if lower is None else lower
+        in_place = [text[start:end].strip() == s for s, start, end in sentences_with_offsets]
+        segments = [(start, end) for (_, start, end), ok in zip(sentences_with_offsets, in_place) if ok]
+        segment_hits = iter(_scan_segments(text, segments, text_lower))
+        sentence_hits = [
+            next(segment_hits) if ok else _scan_segments(s, [(0, len(s))])[0]
+            for s, ok in zip(sentences, in_place)
+        ]
+
+        # Matches are deduplicated on (description, trigger) as they are collected, so a long
+        # document carries one row per distinct finding instead of one per occurrence. The
+        # dict keeps the first match per key in insertion order with a single lookup each.
+        unique_matches: dict[tuple[str, str | None], _AssumptionMatch] = {}
+
+        def _collect(matches: list[_AssumptionMatch]) -> None:
+            for m in matches:
+                unique_matches.setdefault((m.description, m.trigger or None), m)
+
+        # Sentences are independent until deduplication. On free-threaded builds long
+        # documents are checked in batches across threads; map keeps batch order, so the
+        # first match per key is the same as in the serial loop.
+        pairs = list(zip(sentences, sentence_hits))
+        if FREE_THREADED and len(pairs) >= PARALLEL_MIN_SENTENCES:
+            batches = [pairs[i:i + SENTENCE_BATCH_SIZE] for i in range(0, len(pairs), SENTENCE_BATCH_SIZE)]
+            with ThreadPoolExecutor(max_workers=min(len(batches), os.cpu_count() or 1)) as pool:
+                batch_matches = list(pool.map(self._sentence_matches, batches))
+        else:
+            batch_matches = [self._sentence_matches(pairs)]
+        for matches in batch_matches:
+            _collect(matches)
+
+        # Each sentence's position (first occurrence for repeated sentences), so matches
+        # resolve to their context with one dict lookup instead of a linear search
+        first_index: dict[str, int] = {}
+        for i, s in enumerate(sentences):
+            first_index.setdefault(s, i)
 
         # Step 5: Expanded evidence/justification markers for context validation
         # Exclude "support" (ambiguous: "evidence supports" vs "why do you still support")
@@ -502,7 +686,7 @@ class HiddenAssumptionExtractor:
         def _has_justification_nearby(
             sent: str, sent_list: list[str], detection_type: str = ""
         ) -> bool:
-            idx = next((i for i, s in enumerate(sent_list) if s == sent), -1)
+            idx = first_index.get(sent, -1)
             if idx < 0:
                 return False
             # Check sentence + 2 before + 2 after (Step 5: local context)
@@ -513,7 +697,7 @@ class HiddenAssumptionExtractor:
             for phrase in ("evidence shows", "evidence indicates", "evidence demonstrates"):
                 if phrase in context:
                     return True
-            words = set(re.findall(r"\b\w+\b", context))
+            words = set(_WORD_RE.findall(context))
             # For vague_authority, exclude "study/studies/shows" (often part of the pattern)
             base_words = frozenset({
                 "because", "since", "data", "research", "supporting",
@@ -525,7 +709,7 @@ class HiddenAssumptionExtractor:
 
         def _premises_provided_earlier(sent: str, sent_list: list[str]) -> bool:
             """Layer B: For conclusion markers, check if premises exist in earlier sentences."""
-            idx = next((i for i, s in enumerate(sent_list) if s == sent), -1)
+            idx = first_index.get(sent, -1)
             if idx < 1:
                 return False
             earlier = " ".join(sent_list[:idx]).lower()
@@ -535,7 +719,7 @@ class HiddenAssumptionExtractor:
             if "evidence shows" in earlier or "evidence indicates" in earlier or "data show" in earlier:
                 return True
             premise_words = {"data", "study", "shows", "indicates", "demonstrates"}
-            words = set(re.findall(r"\b\w+\b", earlier))
+            words = set(_WORD_RE.findall(earlier))
             return bool(words & premise_words)
 
         def _is_meta_language(sent: str) -> bool:
@@ -549,35 +733,29 @@ class HiddenAssumptionExtractor:
             absence_of_support,
         )
 
-        # Deduplicate; apply Layer B, calibrated scoring, meta-language, precision threshold
-        seen: set[str] = set()
+        # Apply Layer B, calibrated scoring, meta-language, precision threshold. The display
+        # string is only formatted for flags that are kept.
         result: list[AssumptionFlag] = []
         CONFIDENCE_FLOOR = 0.60  # Step 8: Precision > recall; only flag when confident
-
-        for m in all_matches:
-            full = f"{m.description} [trigger: '{m.trigger}']" if m.trigger else m.description
-            if full not in seen:
-                seen.add(full)
-                # Layer B: enthymeme — if premises provided, suppress
-                if m.detection_type == "conclusion_marker" and _premises_provided_earlier(m.sentence, sentences):
-                    continue
-                has_support = _has_justification_nearby(m.sentence, sentences, m.detection_type)
-                # Step 4: Calibrated scoring
-                modal = modal_strength_from_type(m.detection_type)
-                causal = 0.7 if m.detection_type == "causal" else 0.3
-                absent = absence_of_support(has_support)
-                normative = 0.6 if (
-                    "value" in m.description.lower()
-                    or "necessity" in m.description.lower()
-                    or "necessary" in m.description.lower()
-                ) else 0.3
-                conf = assumption_score(modal, causal, absent, normative)
-                # Suppressions
-                conf = _apply_suppressions(conf, m.sentence, _compute_density_factor(text))
-                if _is_meta_language(m.sentence):
-                    conf *= 0.5  # Step 7: meta-language
-                conf = max(0.0, min(0.95, conf))
-                if conf >= CONFIDENCE_FLOOR:
-                    result.append(AssumptionFlag(description=full, sentence=m.sentence, confidence=conf))
+        density_factor = _compute_density_factor(text, text_lower)
+
+        for m in unique_matches.values():
+            # Layer B: enthymeme — if premises provided, suppress
+            if m.detection_type == "conclusion_marker" and _premises_provided_earlier(m.sentence, sentences):
+                continue
+            has_support = _has_justification_nearby(m.sentence, sentences, m.detection_type)
+            # Step 4: Calibrated scoring
+            modal = modal_strength_from_type(m.detection_type)
+            causal = 0.7 if m.detection_type == "causal" else 0.3
+            absent = absence_of_support(has_support)
+            normative = _normative_weight(m.description)
+            conf = assumption_score(modal, causal, absent, normative)
+            # Suppressions
+            conf = _apply_suppressions(conf, m.sentence, density_factor)
+            if _is_meta_language(m.sentence):
+                conf *= 0.5  # Step 7: meta-language (stays within the 0-0.95 clamp above)
+            if conf >= CONFIDENCE_FLOOR:
+                full = f"{m.description} [trigger: '{m.trigger}']" if m.trigger else m.description
+                result.append(AssumptionFlag(description=full, sentence=m.sentence, confidence=conf))
 
         return result
@@ -1,9 +1,12 @@
 """Pattern-based logical fallacy detection."""
 
 import re
+from dataclasses import replace
 
+from discourse_engine.analyzers.base import BatchAnalyzer
 from discourse_engine.models.report import FallacyFlag
 from discourse_engine.scoring import fallacy_confidence
+from discourse_engine.utils.cache import ResultCache
 from discourse_engine.utils.text_utils import (
     sentence_containing_offset,
     split_sentences_with_offsets,
@@ -13,6 +16,11 @@ from discourse_engine.utils.text_utils import (
 FALSE_DILEMMA_PATTERN = re.compile(
     r"\beither\b.*\bor\b", re.IGNORECASE | re.DOTALL
 )
+# FALSE_DILEMMA_PATTERN in two linear searches: it matches exactly when the first "either"
+# has an "or" somewhere after it, and then starts at that "either". The fused pattern's
+# greedy .* instead runs to the end of the text from every "either" it tries.
+_EITHER_WORD = re.compile(r"\beither\b", re.IGNORECASE)
+_OR_WORD = re.compile(r"\bor\b", re.IGNORECASE)
 # Capture "either X or Y" to extract the second option
 EITHER_OR_CAPTURE = re.compile(
     r"\beither\b(.+?)\bor\b(.+)$", re.IGNORECASE | re.DOTALL
@@ -29,6 +37,10 @@ GENUINE_DICHOTOMY_PATTERNS = (
     re.compile(r"\bno\b(?!\s+one|\s+longer)", re.IGNORECASE),
     re.compile(r"\bnever\b", re.IGNORECASE),
 )
+# All of the above in one alternation: a single search answers "any negation present"
+_GENUINE_DICHOTOMY_RE = re.compile(
+    "|".join(f"(?:{pat.pattern})" for pat in GENUINE_DICHOTOMY_PATTERNS), re.IGNORECASE
+)
 # Complementary pairs: both options exhaust the space
 COMPLEMENTARY_PAIRS = frozenset(
     {
@@ -160,10 +172,13 @@ SLIPPERY_SLOPE_EXTREME_TERMS = (
 )
 
 
+_CLAUSE_WORD_RE = re.compile(r"\b[a-z]{2,}\b")
+
+
 def _clause_similarity(left: str, right: str) -> float:
     """Very lightweight bag-of-words similarity for circular reasoning."""
-    left_words = set(re.findall(r"\b[a-z]{2,}\b", left.lower()))
-    right_words = set(re.findall(r"\b[a-z]{2,}\b", right.lower()))
+    left_words = set(_CLAUSE_WORD_RE.findall(left.lower()))
+    right_words = set(_CLAUSE_WORD_RE.findall(right.lower()))
     if not left_words or not right_words:
         return 0.0
     overlap = len(left_words & right_words)
@@ -178,7 +193,7 @@ def _is_genuine_dichotomy(text: str) -> bool:
     first = m.group(1).strip().rstrip(".,;:!?").lower()
     second = m.group(2).strip().rstrip(".,;:!?").lower()
     # Check for negation in second option (doesn't, isn't, not, etc.)
-    if any(pat.search(second) for pat in GENUINE_DICHOTOMY_PATTERNS):
+    if _GENUINE_DICHOTOMY_RE.search(second):
         return True
     # Check for complementary pairs (true/false, yes/no)
     first_word = first.split()[-1] if first else ""
@@ -215,6 +230,12 @@ FEAR_TERMS = {
     "dark age",
     "dark ages",
 }
+# Longest terms first, so the alternation is deterministic whatever the set's order.
+# FEAR_RE finds the earliest whole-word use to cite; any substring use (e.g. "threatening")
+# is still enough to raise the flag, as before.
+_FEAR_ALTERNATION = "|".join(re.escape(t) for t in sorted(FEAR_TERMS, key=lambda t: (-len(t), t)))
+FEAR_RE = re.compile(rf"\b(?:{_FEAR_ALTERNATION})\b", re.IGNORECASE)
+_FEAR_SUBSTRING_RE = re.compile(_FEAR_ALTERNATION)
 
 # Ad hominem / attack:
 # - "they want to destroy..."
@@ -257,21 +278,44 @@ APPEAL_TO_TRADITION_PATTERNS = [
 ]
 
 
-class LogicalFallacyAnalyzer:
+# Results are a pure function of the text; repeated turns and re-runs skip the patterns
+_RESULTS: ResultCache[list[FallacyFlag]] = ResultCache(lambda flags: [replace(f) for f in flags])
+
+
+class LogicalFallacyAnalyzer(BatchAnalyzer[list[FallacyFlag]]):
     """Flags possible logical fallacies via pattern matching."""
 
-    def analyze(self, text: str) -> list[FallacyFlag]:
-        """Return list of FallacyFlag for detected patterns."""
+    def analyze(
+        self,
+        text: str,
+        *,
+        lower: str | None = None,
+        sentences_with_offsets: list[tuple[str, int, int]] | None = None,
+    ) -> list[FallacyFlag]:
+        """
+        Return list of FallacyFlag for detected patterns. The pipeline passes its own
+        text.lower() and sentence split as lower and sentences_with_offsets.
+        """
+        return _RESULTS.get(None, text, lambda: self._analyze(text, lower, sentences_with_offsets))
+
+    def _analyze(
+        self,
+        text: str,
+        lower: str | None = None,
+        sentences_with_offsets: list[tuple[str, int, int]] | None = None,
+    ) -> list[FallacyFlag]:
         flags: list[FallacyFlag] = []
-        lower = text.lower()
-        sentences_with_offsets = split_sentences_with_offsets(text)
+        if lower is None:
+            lower = text.lower()
+        if sentences_with_offsets is None:
+            sentences_with_offsets = split_sentences_with_offsets(text)
 
         def _sentence_at(match: re.Match) -> str:
             return sentence_containing_offset(sentences_with_offsets, match.start())
 
         # False dilemma patterns
-        m = FALSE_DILEMMA_PATTERN.search(text)
-        if m:
+        m = _EITHER_WORD.search(text)
+        if m and _OR_WORD.search(text, m.end()):
             # Use full sentence for dichotomy check so we see the clause after "or"
             full_sentence = _sentence_at(m)
             if not _is_genuine_dichotomy(full_sentence):
@@ -330,11 +374,8 @@ class LogicalFallacyAnalyzer:
             )
 
         # Appeal to fear
-        if any(t in lower for t in FEAR_TERMS):
-            fear_match = next(
-                (re.search(rf"\b{re.escape(t)}\b", text, re.IGNORECASE) for t in FEAR_TERMS if t in lower),
-                None,
-            )
+        fear_match = FEAR_RE.search(text)
+        if fear_match or _FEAR_SUBSTRING_RE.search(lower):
             sent = (
                 _sentence_at(fear_match)
                 if fear_match
@@ -538,7 +579,7 @@ class LogicalFallacyAnalyzer:
         try:
             from discourse_engine.v3.narrative_arc import compute_logical_leaps
 
-            leaps = compute_logical_leaps(text)
+            leaps = compute_logical_leaps(text, [s for s, _, _ in sentences_with_offsets])
         except Exception:
             leaps = []
 
@@ -3,9 +3,28 @@
 import re
 from dataclasses import dataclass
 
+from discourse_engine.analyzers.base import BatchAnalyzer
+from discourse_engine.utils.cache import ResultCache
+
 MODAL_VERBS = {"must", "should", "could", "would", "might", "can", "will", "shall"}
 PRONOUNS = ["we", "they", "us", "them", "i", "you"]
 
+# Deletes ASCII punctuation inside whitespace-separated tokens ("us." -> "us", "can't" ->
+# "cant"); whitespace and word characters survive so str.split() still sees the tokens
+_STRIP_ASCII_NON_WORD = str.maketrans({
+    c: None for c in map(chr, range(128)) if not (c.isalnum() or c == "_" or c.isspace())
+})
+_NON_WORD_RE = re.compile(r"\W+")
+
+
+def _clean_tokens(lower: str) -> list[str]:
+    """Whitespace-split tokens with non-word characters stripped from each one."""
+    tokens = lower.translate(_STRIP_ASCII_NON_WORD).split()
+    if lower.isascii():
+        return tokens
+    # Unicode punctuation (curly quotes, dashes) is left to the regex, token by token
+    return [t if t.isascii() else _NON_WORD_RE.sub("", t) for t in tokens]
+
 
 @dataclass
 class ModalPronounResult:
@@ -14,23 +33,22 @@ class ModalPronounResult:
     pronoun_insight: str | None
 
 
-class ModalPronounAnalyzer:
+class ModalPronounAnalyzer(BatchAnalyzer[ModalPronounResult]):
     """Extracts modal verbs and pronoun usage for authority/framing analysis."""
 
-    def analyze(self, text: str) -> ModalPronounResult:
-        """Return modal verbs found, pronoun counts, and optional insight."""
-        words = text.lower().split()
+    def analyze(self, text: str, *, lower: str | None = None) -> ModalPronounResult:
+        """Return modal verbs found, pronoun counts, and optional insight (lower: text.lower(), if known)."""
+        return _RESULTS.get(None, text, lambda: self._analyze(text, lower))
+
+    def _analyze(self, text: str, lower: str | None = None) -> ModalPronounResult:
+        words = _clean_tokens(text.lower() if lower is None else lower)
         modal_verbs: list[str] = []
         seen_modals: set[str] = set()
-        for w in words:
-            clean = re.sub(r"\W+", "", w)
+        pronoun_framing: dict[str, int] = {p: 0 for p in PRONOUNS}
+        for clean in words:
             if clean in MODAL_VERBS and clean not in seen_modals:
                 seen_modals.add(clean)
                 modal_verbs.append(clean)
-
-        pronoun_framing: dict[str, int] = {p: 0 for p in PRONOUNS}
-        for w in words:
-            clean = re.sub(r"\W+", "", w)
             if clean in pronoun_framing:
                 pronoun_framing[clean] += 1
 
@@ -48,3 +66,12 @@ class ModalPronounAnalyzer:
             pronoun_framing=pronoun_framing,
             pronoun_insight=insight,
         )
+
+
+def _copy_result(result: ModalPronounResult) -> ModalPronounResult:
+    """Fresh containers, so callers can mutate a cached result safely."""
+    return ModalPronounResult(list(result.modal_verbs), dict(result.pronoun_framing), result.pronoun_insight)
+
+
+# Results are a pure function of the text
+_RESULTS: ResultCache[ModalPronounResult] = ResultCache(_copy_result)
@@ -12,20 +12,27 @@ self-undermining incongruity - not just emotional intensity.
 
 import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 
+from discourse_engine.analyzers.base import BatchAnalyzer
+from discourse_engine.utils.cache import ResultCache
+from discourse_engine.utils.patterns import RuleScanner, fold_pattern, trie_alternation
 
-def _load_lexicon(lexicon_dir: Path, name: str) -> list:
-    """Load a JSON lexicon file (list or dict)."""
+
+@lru_cache(maxsize=32)
+def _load_lexicon(lexicon_dir: Path, name: str) -> tuple:
+    """Load a JSON list lexicon file (cached per directory and name; immutable)."""
     path = lexicon_dir / f"{name}.json"
     if not path.exists():
-        return []
+        return ()
     with open(path, encoding="utf-8") as f:
-        return json.load(f)
+        data = json.load(f)
+    return tuple(data) if isinstance(data, list) else ()
 
 
-@dataclass
+@dataclass(slots=True)
 class SatireSignal:
     """A detected signal that text may be satirical."""
 
@@ -38,15 +45,15 @@ class SatireSignal:
 # These are IMPLAUSIBLE in real political context. "Ruled by cats" = absurd.
 # "Military operations in Iran" = plausible.
 ABSURD_OUTCOME_PHRASES = (
-    r"\bruled by cats\b",
-    r"\bzombie\w*\b",
-    r"\bchaos ruled by\b",
-    r"\buniverse will collapse\b",
-    r"\bsociety will (?:turn into|become)\s+\w+\s+(?:ruled by|run by)",
-    r"\b(melt|explode|implode)\s+into\s+(?:cats|zombies|bananas)\b",
-    r"\bend of (?:the )?universe\b",
-    r"\bdeath panel\b",
-    r"\bliterally\s+(?:everything|the worst)\b",
+    re.compile(r"\bruled by cats\b"),
+    re.compile(r"\bzombie\w*\b"),
+    re.compile(r"\bchaos ruled by\b"),
+    re.compile(r"\buniverse will collapse\b"),
+    re.compile(r"\bsociety will (?:turn into|become)\s+\w+\s+(?:ruled by|run by)"),
+    re.compile(r"\b(melt|explode|implode)\s+into\s+(?:cats|zombies|bananas)\b"),
+    re.compile(r"\bend of (?:the )?universe\b"),
+    re.compile(r"\bdeath panel\b"),
+    re.compile(r"\bliterally\s+(?:everything|the worst)\b"),
 )
 ABSURD_NOUNS = frozenset({
     "cats", "dogs", "penguins", "zombies", "aliens", "unicorns",
@@ -56,23 +63,100 @@ INCONGRUITY_PATTERN = re.compile(
     r"\b(?:ruled by|run by|led by|controlled by|governed by)\s+(\w+)",
     re.IGNORECASE,
 )
+# Case-sensitive twin for lowercased text; every match contains " by" once lowercased
+_INCONGRUITY_FOLDED = fold_pattern(INCONGRUITY_PATTERN)
 
 # Disproportionate causation ONLY when consequence is absurd
 # "one small change -> universe collapse" or "chaos ruled by cats"
-DISPROPORTIONATE_ABSURD = re.compile(
+_TRIVIAL_CAUSE_SOURCE = (
     r"\b(?:if|when)\s+(?:we\s+)?(?:allow|pass|do)\s+(?:one\s+)?(?:small|tiny|minor|single)\s+"
-    r"(?:\w+\s+){0,3}(?:change|policy|thing)\b.*?"
-    r"(?:universe\s+will\s+collapse|chaos\s+ruled\s+by|ruled\s+by\s+(?:cats|zombies))",
+    r"(?:\w+\s+){0,3}(?:change|policy|thing)"
+)
+_ABSURD_CONSEQUENCE_SOURCE = r"(?:universe\s+will\s+collapse|chaos\s+ruled\s+by|ruled\s+by\s+(?:cats|zombies))"
+DISPROPORTIONATE_ABSURD = re.compile(
+    _TRIVIAL_CAUSE_SOURCE + r"\b.*?" + _ABSURD_CONSEQUENCE_SOURCE,
     re.IGNORECASE | re.DOTALL,
 )
+# The two halves of DISPROPORTIONATE_ABSURD, searched separately (see _is_disproportionate).
+# Every consequence starts with a word character, so the cause's closing \b can only hold
+# before a non-word character; spelling it (?=\W) keeps it exact under a search endpos.
+_TRIVIAL_CAUSE = re.compile(_TRIVIAL_CAUSE_SOURCE + r"(?=\W)", re.IGNORECASE)
+_ABSURD_CONSEQUENCE = re.compile(_ABSURD_CONSEQUENCE_SOURCE, re.IGNORECASE)
+# Every consequence contains one of these once lowercased (no other character case-folds to
+# their letters), so a text with neither skips both searches
+_ABSURD_CONSEQUENCE_CANARIES = ("ruled", "colla")
+
+
+def _is_disproportionate(text: str, lower: str | None = None) -> bool:
+    """
+    Same answer as DISPROPORTIONATE_ABSURD.search(text), in linear time: find where the last
+    absurd consequence starts, then look for a trivial cause that ends before it. The fused
+    pattern instead runs a lazy .*? to the end of the text from every cause it tries.
+    Callers that already hold text.lower() can pass it as lower.
+    """
+    if lower is None:
+        lower = text.lower()
+    if not any(c in lower for c in _ABSURD_CONSEQUENCE_CANARIES):
+        return False
+    last = -1
+    m = _ABSURD_CONSEQUENCE.search(text)
+    while m is not None:
+        last = m.start()
+        m = _ABSURD_CONSEQUENCE.search(text, last + 1)
+    # endpos last + 1 lets the cause's lookahead see (and reject) the consequence's first letter
+    return last >= 0 and _TRIVIAL_CAUSE.search(text, 0, last + 1) is not None
+
 
 # Self-undermining (satire mocks its own premise)
 CONTRADICTION_MARKERS = (
-    r"\bbecause\s+it\s+completely\s+ignores\b",
-    r"\bperfect\s+because\s+it\s+(?:ignores|rejects)\b",
-    r"\bthe\s+best\s+plan\s+that\s+ignores\b",
+    re.compile(r"\bbecause\s+it\s+completely\s+ignores\b"),
+    re.compile(r"\bperfect\s+because\s+it\s+(?:ignores|rejects)\b"),
+    re.compile(r"\bthe\s+best\s+plan\s+that\s+ignores\b"),
+)
+
+# Escalation beyond plausible range: universal scope + high frequency + subjective measure
+ESCALATION_UNIVERSAL = re.compile(r"\b(?:every|all|each)\s+(?:citizen|person|voter)\b")
+ESCALATION_FREQUENT = re.compile(r"\b(?:weekly|daily|hourly)\b")
+ESCALATION_SUBJECTIVE = re.compile(r"\b(?:emotional|approval|sentiment|satisfaction|feelings?)\b")
+
+
+def _fuse(patterns: tuple[re.Pattern, ...]) -> re.Pattern:
+    """One alternation of flagless patterns: a single pass finds whether any of them matches."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns))
+
+
+_ABSURD_OUTCOME_RE = _fuse(ABSURD_OUTCOME_PHRASES)
+_CONTRADICTION_RE = _fuse(CONTRADICTION_MARKERS)
+
+# Yes/no satire categories, answered together by one scanner call over the document. The
+# patterns above are written for lowercased text; the scanner runs them case-insensitively,
+# which on lowered text is the same thing. Each pattern carries canaries (literals every
+# match contains), so a pattern whose canaries are absent costs a substring check, not a scan.
+_SATIRE_CHECKS: tuple[tuple[str, re.Pattern, tuple[str, ...]], ...] = (
+    ("absurd_outcome", _ABSURD_OUTCOME_RE, (
+        "ruled by cats", "zombie", "chaos ruled by", "society will", "into", "universe",
+        "death panel", "literally",
+    )),
+    ("contradiction", _CONTRADICTION_RE, ("ignores", "rejects")),
+    ("escalation_universal", ESCALATION_UNIVERSAL, ("citizen", "person", "voter")),
+    ("escalation_frequent", ESCALATION_FREQUENT, ("weekly", "daily", "hourly")),
+    ("escalation_subjective", ESCALATION_SUBJECTIVE,
+     ("emotional", "approval", "sentiment", "satisfaction", "feeling")),
+)
+_SATIRE_SCANNER = RuleScanner(
+    (i, (pat if pat.flags & re.IGNORECASE else pat.pattern,), canaries)
+    for i, (_, pat, canaries) in enumerate(_SATIRE_CHECKS)
 )
 
+
+def _satire_categories(text: str, lower: str) -> set[str]:
+    """Names of the yes/no satire categories with at least one match in text."""
+    categories = {_SATIRE_CHECKS[i][0] for i in _SATIRE_SCANNER.first_matches(text, lower)}
+    if _is_disproportionate(text, lower):
+        categories.add("disproportionate")
+    return categories
+
+
 # === Policy plausibility ontology (Layer 2) ===
 # Implausible policies: enforceable emotions, mandatory feelings
 DEFAULT_IMPLAUSIBLE_POLICY_PATTERNS = [
@@ -111,49 +195,70 @@ GEOPOLITICAL_TERMS = frozenset({
 })
 
 
-def _implausible_policy_score(text: str, patterns: list) -> float:
+@lru_cache(maxsize=32)
+def _compile_policy_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern | str, ...]:
+    """Compile lexicon patterns once; entries that are not valid regexes stay as lowercase literals."""
+    compiled: list[re.Pattern | str] = []
+    for pat in patterns:
+        try:
+            compiled.append(re.compile(pat, re.IGNORECASE))
+        except re.error:
+            compiled.append(pat.lower())
+    return tuple(compiled)
+
+
+# Word and hyperbole patterns, compiled once; all run on lowercased text
+_WORD_RE = re.compile(r"\b\w+\b")
+# Whole-word geopolitical terms, found by one scan instead of collecting every word of the text
+_GEOPOLITICAL_RE = re.compile(rf"\b(?:{trie_alternation(GEOPOLITICAL_TERMS)})\b")
+# The four hyperbole families share no word, so one left-to-right pass with a group per
+# family finds exactly what a separate search per family would
+_HYPERBOLE_RE = re.compile(
+    r"\b(?:(?P<absolutist>never|always|all|everyone|everybody)"
+    r"|(?P<catastrophe>collapse|destroy|chaos|catastrophe|certain death)"
+    r"|(?P<magnitude>(?:thousands|millions)\s+(?:and\s+)?(?:thousands|millions))"
+    r"|(?P<intensifier>perfect|completely|totally))\b"
+)
+
+
+def _implausible_policy_score(lower: str, patterns: list) -> float:
     """0-1: Implausible policy phrases (enforceable emotions, mandatory feelings)."""
     if not patterns:
         return 0.0
-    lower = text.lower()
-    for pat in patterns:
-        if isinstance(pat, str):
-            try:
-                if re.search(pat, lower, re.IGNORECASE):
-                    return 0.7
-            except re.error:
-                if pat.lower() in lower:
-                    return 0.7
+    # Non-string lexicon entries are ignored
+    for pat in _compile_policy_patterns(tuple(p for p in patterns if isinstance(p, str))):
+        if pat in lower if isinstance(pat, str) else pat.search(lower):
+            return 0.7
     return 0.0
 
 
-def _escalation_absurdity_score(text: str) -> float:
+def _escalation_absurdity_score(categories: set[str]) -> float:
     """0-1: Universal scope + high-frequency + subjective measure = implausible."""
-    lower = text.lower()
-    has_universal = bool(re.search(r"\b(?:every|all|each)\s+(?:citizen|person|voter)\b", lower))
-    has_frequent = bool(re.search(r"\b(?:weekly|daily|hourly)\b", lower))
-    has_subjective = bool(re.search(r"\b(?:emotional|approval|sentiment|satisfaction|feelings?)\b", lower))
+    has_universal = "escalation_universal" in categories
+    has_frequent = "escalation_frequent" in categories
+    has_subjective = "escalation_subjective" in categories
     if has_universal and has_frequent and has_subjective:
         return 0.75
     return 0.0
 
 
-def _value_clash_score(text: str) -> float:
+def _value_clash_score(text: str, sentences: list[str] | None = None) -> float:
     """0-1: Claim to protect X (freedom) then propose policy that restricts X."""
     from discourse_engine.utils.text_utils import split_sentences
 
-    sentences = split_sentences(text)
+    if sentences is None:
+        sentences = split_sentences(text)
     if len(sentences) < 2:
         return 0.0
 
     # Value terms in first half
     first_half = " ".join(sentences[: len(sentences) // 2 + 1]).lower()
-    words_first = set(re.findall(r"\b\w+\b", first_half))
+    words_first = set(_WORD_RE.findall(first_half))
     has_value = bool(words_first & VALUE_TERMS_FOR_CLASH)
 
     # Obligation in second half
     second_half = " ".join(sentences[len(sentences) // 2 :]).lower()
-    words_second = set(re.findall(r"\b\w+\b", second_half))
+    words_second = set(_WORD_RE.findall(second_half))
     has_obligation = bool(words_second & OBLIGATION_TERMS)
 
     if has_value and has_obligation:
@@ -161,68 +266,82 @@ def _value_clash_score(text: str) -> float:
     return 0.0
 
 
-def _absurdity_score(text: str, implausible_patterns: list | None = None) -> float:
+def _absurdity_score(
+    text: str, lower: str, categories: set[str], implausible_patterns: list | None = None
+) -> float:
     """0-1: Semantic absurdity. High only for impossible/playful outcomes."""
-    lower = text.lower()
     score = 0.0
 
     # Explicit absurd phrases
-    for pat in ABSURD_OUTCOME_PHRASES:
-        if re.search(pat, lower):
-            score = max(score, 0.85)
-            break
+    if "absurd_outcome" in categories:
+        score = max(score, 0.85)
 
     # "Ruled by X" where X is absurd
-    for m in INCONGRUITY_PATTERN.finditer(text):
-        if m.group(1).lower() in ABSURD_NOUNS:
-            score = max(score, 0.9)
-            break
+    if " by" in lower:
+        # The lowered text stands in for text only while their offsets line up
+        if len(lower) == len(text):
+            matches = _INCONGRUITY_FOLDED.finditer(lower)
+        else:
+            matches = INCONGRUITY_PATTERN.finditer(text)
+        for m in matches:
+            if m.group(1).lower() in ABSURD_NOUNS:
+                score = max(score, 0.9)
+                break
 
     # Trivial cause -> absurd consequence
-    if DISPROPORTIONATE_ABSURD.search(text):
+    if "disproportionate" in categories:
         score = max(score, 0.8)
 
     # Policy plausibility ontology (Layer 2)
     patterns = implausible_patterns or DEFAULT_IMPLAUSIBLE_POLICY_PATTERNS
-    score = max(score, _implausible_policy_score(text, patterns))
+    score = max(score, _implausible_policy_score(lower, patterns))
 
     # Escalation beyond plausible range
-    score = max(score, _escalation_absurdity_score(text))
+    score = max(score, _escalation_absurdity_score(categories))
 
     return score
 
 
-def _incongruity_score(text: str, value_clash: float = 0.0) -> float:
+def _incongruity_score(categories: set[str], value_clash: float = 0.0) -> float:
     """0-1: Self-undermining, internal contradiction, value clash."""
-    lower = text.lower()
     base = 0.0
-    if any(re.search(pat, lower) for pat in CONTRADICTION_MARKERS):
+    if "contradiction" in categories:
         base = 0.8
     return max(base, value_clash)
 
 
-def _hyperbole_score(text: str) -> float:
+def _hyperbole_score(lower: str) -> float:
     """0-1: Intensifiers, absolutism. Note: War speeches have this too - not sufficient alone."""
-    lower = text.lower()
+    seen: set[str] = set()
+    catastrophe_matches = 0
+    for m in _HYPERBOLE_RE.finditer(lower):
+        if m.lastgroup == "catastrophe":
+            catastrophe_matches += 1
+        else:
+            seen.add(m.lastgroup)
+        # Two catastrophe words already earn the full catastrophe weight
+        if catastrophe_matches >= 2 and len(seen) == 3:
+            break
     score = 0.0
-    if re.search(r"\b(?:never|always|all|everyone|everybody)\b", lower):
+    if "absolutist" in seen:
         score += 0.2
-    catastrophe_matches = len(re.findall(r"\b(?:collapse|destroy|chaos|catastrophe|certain death)\b", lower))
     score += min(0.2 + catastrophe_matches * 0.1, 0.4)  # multiple catastrophe words = stronger
-    if re.search(r"\b(?:thousands|millions)\s+(?:and\s+)?(?:thousands|millions)\b", lower):
+    if "magnitude" in seen:
         score += 0.15
-    if re.search(r"\b(?:perfect|completely|totally)\b", lower):
+    if "intensifier" in seen:
         score += 0.15
     return min(max(score, 0.2), 0.7)
 
 
-def _context_plausibility_score(text: str) -> float:
+def _context_plausibility_score(lower: str) -> float:
     """0-1: Higher = more plausible real-world political/military context."""
-    lower = text.lower()
-    words = set(re.findall(r"\b[a-z]{4,}\b", lower))
-    overlap = len(words & GEOPOLITICAL_TERMS)
-    if overlap >= 5:
-        return 0.9
+    found: set[str] = set()
+    for m in _GEOPOLITICAL_RE.finditer(lower):
+        found.add(m.group())
+        if len(found) >= 5:
+            # The score tops out here; the rest of the text cannot change it
+            return 0.9
+    overlap = len(found)
     if overlap >= 3:
         return 0.7
     if overlap >= 1:
@@ -230,7 +349,12 @@ def _context_plausibility_score(text: str) -> float:
     return 0.2
 
 
-class SatireAnalyzer:
+_RESULTS: ResultCache[tuple[float, list[SatireSignal], str]] = ResultCache(
+    lambda result: (result[0], [replace(s) for s in result[1]], result[2])
+)
+
+
+class SatireAnalyzer(BatchAnalyzer[tuple[float, list[SatireSignal], str]]):
     """
     Satire detector using: Satire = (H * A * I) / (0.5 + C)
 
@@ -247,21 +371,48 @@ class SatireAnalyzer:
             lexicon_dir = Path(__file__).parent.parent / "lexicons"
         self.lexicon_dir = Path(lexicon_dir)
         raw = _load_lexicon(self.lexicon_dir, "implausible_policy_phrases")
-        self._implausible_patterns = raw if isinstance(raw, list) else []
-
-    def analyze(self, text: str) -> tuple[float, list[SatireSignal], str]:
+        self._implausible_patterns = list(raw)
+        # Results depend only on the text and the implausible-policy lexicon (its string entries)
+        self._cache_config = tuple(p for p in self._implausible_patterns if isinstance(p, str))
+
+    def analyze(
+        self,
+        text: str,
+        *,
+        lower: str | None = None,
+        sentences_with_offsets: list[tuple[str, int, int]] | None = None,
+    ) -> tuple[float, list[SatireSignal], str]:
         """
+        lower (text.lower()) and sentences_with_offsets (split_sentences_with_offsets(text)),
+        when given, are computed by the caller.
+
         Returns:
             (probability, signals, content_type_hint)
         """
+        return _RESULTS.get(
+            self._cache_config, text, lambda: self._analyze(text, lower, sentences_with_offsets)
+        )
+
+    def _analyze(
+        self,
+        text: str,
+        lower: str | None = None,
+        sentences_with_offsets: list[tuple[str, int, int]] | None = None,
+    ) -> tuple[float, list[SatireSignal], str]:
         if not text or not text.strip():
             return 0.0, [], "Uncertain"
 
-        H = _hyperbole_score(text)
-        A = _absurdity_score(text, self._implausible_patterns)
-        value_clash = _value_clash_score(text)
-        I = _incongruity_score(text, value_clash)
-        C = _context_plausibility_score(text)
+        # One lowercase copy serves every score below
+        if lower is None:
+            lower = text.lower()
+        categories = _satire_categories(text, lower)
+        H = _hyperbole_score(lower)
+        A = _absurdity_score(text, lower, categories, self._implausible_patterns)
+        value_clash = _value_clash_score(
+            text, None if sentences_with_offsets is None else [s for s, _, _ in sentences_with_offsets]
+        )
+        I = _incongruity_score(categories, value_clash)
+        C = _context_plausibility_score(lower)
 
         signals: list[SatireSignal] = []
 
@@ -1,11 +1,21 @@
 """Basic text statistics analyzer."""
 
+from discourse_engine.utils.cache import ResultCache
 from discourse_engine.utils.text_utils import count_words, count_sentences
 
 
 class StatisticsAnalyzer:
     """Computes word and sentence counts."""
 
-    def analyze(self, text: str) -> tuple[int, int]:
-        """Return (word_count, sentence_count)."""
-        return count_words(text), count_sentences(text)
+    def analyze(
+        self, text: str, *, sentences_with_offsets: list[tuple[str, int, int]] | None = None
+    ) -> tuple[int, int]:
+        """Return (word_count, sentence_count); a sentence split the caller already made is counted when passed."""
+        return _RESULTS.get(None, text, lambda: (
+            count_words(text),
+            count_sentences(text) if sentences_with_offsets is None else len(sentences_with_offsets),
+        ))
+
+
+# A tuple of ints is immutable, so cached results are handed out as they are
+_RESULTS: ResultCache[tuple[int, int]] = ResultCache(lambda result: result)
@@ -7,6 +7,9 @@ threat markers, plausible-deniability patterns, and structural signals.
 import re
 from typing import TYPE_CHECKING
 
+from discourse_engine.utils.patterns import trie_alternation
+from discourse_engine.utils.text_utils import PUNCT_RE
+
 if TYPE_CHECKING:
     from discourse_engine.models.report import AgendaFlag, AssumptionFlag, TriggerProfile
 
@@ -42,11 +45,30 @@ IMPERATIVE_MARKERS = ("!", "—", "•")
 DEFENSIVE = {"protect", "defend", "against", "threat", "attack", "stand for"}
 FEAR_ORIENTED = {"fear", "afraid", "danger", "collapse", "destroy", "threat", "crisis"}
 
+# Defensive and fear terms are stems: they must start a word ("threats", "attacked") but
+# not sit inside one ("unafraid", "counterattack")
+_DEFENSIVE_RE = re.compile(rf"\b(?:{trie_alternation(DEFENSIVE)})")
+_FEAR_ORIENTED_RE = re.compile(rf"\b(?:{trie_alternation(FEAR_ORIENTED)})")
+_WORD_RE = re.compile(r"\b\w+\b")
+_SOFT_MODAL_IN_TEXT = re.compile(r"\bwould(?:n't)?\b|\bmight\b|\bshall\b")
+_WORD_PART_SPLIT = re.compile(r"[\s\-\']+")
+
+
+def _jargon_in_words(text: str) -> set[str]:
+    """Jargon terms among the words of text once punctuation is stripped from each word."""
+    # Words of two characters or fewer can never clean to a jargon term, so the whole text
+    # is cleaned and split in one go rather than word by word
+    return JARGON_TERMS.intersection(PUNCT_RE.sub("", text).lower().split())
+
+
+def _jargon_in_word_parts(text: str, lower: str | None = None) -> set[str]:
+    """Jargon terms among the hyphen- and apostrophe-separated parts of the words of text."""
+    return JARGON_TERMS.intersection(_WORD_PART_SPLIT.split(text.lower() if lower is None else lower))
+
 
-def _urgent_score(text: str) -> float:
+def _urgent_score(text: str, lower: str) -> float:
     """Weighted urgency: strong markers count more; 'must' alone in long text does not trigger."""
-    lower = text.lower()
-    words = set(re.findall(r"\b\w+\b", lower))
+    words = set(_WORD_RE.findall(lower))
     word_count = max(1, len(lower.split()))
     strong = sum(1 for w in URGENT_STRONG if w in words)
     weak = sum(1 for w in URGENT_WEAK if w in words)
@@ -71,21 +93,23 @@ class ToneAnalyzer:
         hidden_agenda_flags: "list[AgendaFlag] | None" = None,
         modal_verbs: list[str] | None = None,
         pronoun_framing: dict | None = None,
+        lower: str | None = None,
     ) -> list[str]:
-        """Return list of detected tone labels."""
+        """Return list of detected tone labels. lower, when given, is text.lower() computed by the caller."""
         if not text or not text.strip():
             return []
-        lower = text.lower()
+        if lower is None:
+            lower = text.lower()
         words = text.split()
         wc = word_count if word_count is not None else len(words)
         tones: list[str] = []
 
         # Urgent
-        if _urgent_score(text) >= 0.35:
+        if _urgent_score(text, lower) >= 0.35:
             tones.append("Urgent")
-        if any(w in lower for w in DEFENSIVE):
+        if _DEFENSIVE_RE.search(lower):
             tones.append("Defensive")
-        if any(w in lower for w in FEAR_ORIENTED):
+        if _FEAR_ORIENTED_RE.search(lower):
             tones.append("Fear-oriented")
 
         # Passive-aggressive: (1) regex, or (2) structural: You + Epistemic Shortcut + Would/Might
@@ -105,8 +129,7 @@ class ToneAnalyzer:
         # Soft modal from normalized modal list OR raw text (handles "wouldn't")
         has_soft_modal = bool(modal_verbs and any(m in ("would", "might", "shall") for m in modal_verbs))
         if not has_soft_modal:
-            if re.search(r"\bwould(?:n't)?\b", lower) or re.search(r"\bmight\b|\bshall\b", lower):
-                has_soft_modal = True
+            has_soft_modal = _SOFT_MODAL_IN_TEXT.search(lower) is not None
         has_universal_assumption = any(
             "everyone" in (a.description.lower() + " " + a.sentence.lower())
             for a in (hidden_assumptions or [])
@@ -125,25 +148,14 @@ class ToneAnalyzer:
         # Corporate/Clinical: word_count > 50, jargon_density > 10% OR 3+ Obscuration flags, fear Low
         if wc > 50 and trigger_profile and trigger_profile.fear_level == "Low":
             obscuration_count = sum(1 for f in (hidden_agenda_flags or []) if getattr(f, "family", "") == "Obscuration")
-            word_set = {re.sub(r"\W", "", w).lower() for w in words if len(w) > 2}
-            jargon_count = len(word_set & JARGON_TERMS)
+            jargon_count = len(_jargon_in_words(text))
             jargon_density = jargon_count / wc if wc else 0
             if jargon_density >= 0.10 or obscuration_count >= 3:
                 tones.append("Corporate/Clinical")
 
         # Bureaucratic/Clinical: Authority Moderate + high jargon (e.g. "hygiene mandate", "patriotic output")
         if wc > 30 and trigger_profile and trigger_profile.authority_level == "Moderate":
-            word_set: set[str] = set()
-            for w in words:
-                if len(w) <= 2:
-                    continue
-                clean = re.sub(r"\W", "", w).lower()
-                if clean:
-                    word_set.add(clean)
-                for part in re.split(r"[\-\']", w):
-                    if len(part) > 2:
-                        word_set.add(part.lower())
-            jargon_count = len(word_set & JARGON_TERMS)
+            jargon_count = len(_jargon_in_words(text) | _jargon_in_word_parts(text, lower))
             jargon_density = jargon_count / wc if wc else 0
             if jargon_density >= 0.06:
                 if "Bureaucratic/Clinical" not in tones and "Corporate/Clinical" not in tones:
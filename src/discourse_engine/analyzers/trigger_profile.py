@@ -1,25 +1,28 @@
 """Trigger word profile analyzer: fear, authority, identity levels."""
 
 import json
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 
 from discourse_engine.models.report import TriggerProfile
+from discourse_engine.utils.cache import ResultCache
 
 
-def _load_lexicon(lexicon_dir: Path, name: str) -> list[str]:
-    """Load a JSON lexicon file."""
+@lru_cache(maxsize=32)
+def _load_lexicon(lexicon_dir: Path, name: str) -> tuple[str, ...]:
+    """Load a JSON lexicon file, lowercased (cached per directory and name; immutable)."""
     path = lexicon_dir / f"{name}.json"
     if not path.exists():
-        return []
+        return ()
     with open(path, encoding="utf-8") as f:
         data = json.load(f)
-    return data if isinstance(data, list) else []
+    return tuple(t.lower() for t in data if isinstance(t, str)) if isinstance(data, list) else ()
 
 
-def _count_matches(text: str, terms: list[str]) -> int:
-    """Count how many terms appear in text (case-insensitive)."""
-    lower_text = text.lower()
-    return sum(1 for t in terms if t.lower() in lower_text)
+def _count_matches(lower_text: str, lower_terms: tuple[str, ...]) -> int:
+    """Count how many terms appear in already-lowercased text (terms lowercased too)."""
+    return sum(1 for t in lower_terms if t in lower_text)
 
 
 def _count_to_level(count: int) -> str:
@@ -41,14 +44,25 @@ class TriggerProfileAnalyzer:
         self._fear = _load_lexicon(lexicon_dir, "fear_terms")
         self._authority = _load_lexicon(lexicon_dir, "authority_terms")
         self._identity = _load_lexicon(lexicon_dir, "identity_terms")
+        # The loader lowercases terms once per lexicon file, so analyze only lowercases the text
+        self._lower_terms = (self._fear, self._authority, self._identity)
 
-    def analyze(self, text: str) -> TriggerProfile:
-        """Return TriggerProfile with fear, authority, identity levels."""
-        fear_count = _count_matches(text, self._fear) if self._fear else 0
-        authority_count = _count_matches(text, self._authority) if self._authority else 0
-        identity_count = _count_matches(text, self._identity) if self._identity else 0
+    def analyze(self, text: str, *, lower: str | None = None) -> TriggerProfile:
+        """Return TriggerProfile with fear, authority, identity levels (lower: text.lower(), if known)."""
+        # Results depend only on the text and the three lexicons
+        return _RESULTS.get(self._lower_terms, text, lambda: self._analyze(text, lower))
+
+    def _analyze(self, text: str, lower: str | None = None) -> TriggerProfile:
+        # One lowercase copy shared by all three lexicons; each term is a C-level substring test
+        lower_text = text.lower() if lower is None else lower
+        fear_count, authority_count, identity_count = (
+            _count_matches(lower_text, terms) for terms in self._lower_terms
+        )
         return TriggerProfile(
             fear_level=_count_to_level(fear_count),
             authority_level=_count_to_level(authority_count),
             identity_level=_count_to_level(identity_count),
         )
+
+
+_RESULTS: ResultCache[TriggerProfile] = ResultCache(replace)
@@ -1,6 +1,7 @@
 """Pipeline entry point and report formatting."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from discourse_engine.analyzers.statistics import StatisticsAnalyzer
 from discourse_engine.analyzers.trigger_profile import TriggerProfileAnalyzer
@@ -12,6 +13,7 @@ from discourse_engine.analyzers.hidden_agenda import HiddenAgendaAnalyzer
 from discourse_engine.analyzers.satire import SatireAnalyzer
 from discourse_engine.models.report import Report
 from discourse_engine.models.config import Config
+from discourse_engine.utils.text_utils import split_sentences_with_offsets
 
 # Bridge Rule: +40% satire when logical leaps indicate non-sequitur
 BRIDGE_RULE_SATIRE_BOOST = 0.40
@@ -74,53 +76,76 @@ def run_pipeline(text: str, config: Config | None = None, context_note: str | No
         context_note = detect_comedic_context(text)
         text = preprocess_transcript(text)
 
-    satire_prob, satire_signals, content_type = SatireAnalyzer(
-        lexicon_dir=config.lexicon_dir
-    ).analyze(text)
-    trigger = TriggerProfileAnalyzer(lexicon_dir=config.lexicon_dir).analyze(text)
-
-    from discourse_engine.v3.narrative_arc import compute_logical_leaps
-    logical_leaps = compute_logical_leaps(text)
-
-    # Optional LLM enhancement for satire (subtle irony)
-    if config.llm_enhance and (config.llm_api_key or config.ollama_model):
-        from discourse_engine.llm_enhancement import enhance_satire_irony
-        llm_text = _prepare_llm_text(text)
-        satire_prob, satire_signals = enhance_satire_irony(
-            llm_text,
-            satire_prob,
-            satire_signals,
-            trigger_profile=trigger,
-            logical_leaps=logical_leaps,
-            api_key=config.llm_api_key,
-            model=config.llm_model,
-            ollama_model=config.ollama_model,
-            ollama_base=config.ollama_base,
+    # One lowercase copy and one sentence split, shared by the analyzers of this run only
+    lower = text.lower()
+    sentences_with_offsets = split_sentences_with_offsets(text)
+    sentences = [s for s, _, _ in sentences_with_offsets]
+
+    llm_enabled = bool(config.llm_enhance and (config.llm_api_key or config.ollama_model))
+    # The LLM enhancements are network round trips: they run on worker threads so they
+    # overlap each other and the rule-based analyzers. Without them no thread is started.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        satire_prob, satire_signals, content_type = SatireAnalyzer(
+            lexicon_dir=config.lexicon_dir
+        ).analyze(text, lower=lower, sentences_with_offsets=sentences_with_offsets)
+        trigger = TriggerProfileAnalyzer(lexicon_dir=config.lexicon_dir).analyze(text, lower=lower)
+
+        from discourse_engine.v3.narrative_arc import compute_logical_leaps
+        logical_leaps = compute_logical_leaps(text, sentences)
+
+        # Optional LLM enhancement for satire (subtle irony)
+        satire_future = None
+        if llm_enabled:
+            from discourse_engine.llm_enhancement import enhance_satire_irony
+            llm_text = _prepare_llm_text(text)
+            satire_future = pool.submit(
+                enhance_satire_irony,
+                llm_text,
+                satire_prob,
+                satire_signals,
+                trigger_profile=trigger,
+                logical_leaps=logical_leaps,
+                api_key=config.llm_api_key,
+                model=config.llm_model,
+                ollama_model=config.ollama_model,
+                ollama_base=config.ollama_base,
+            )
+
+        assumptions = HiddenAssumptionExtractor(
+            api_key=config.llm_api_key, model=config.llm_model, lexicon_dir=config.lexicon_dir
+        ).analyze(text, lower=lower, sentences_with_offsets=sentences_with_offsets)
+
+        # Optional LLM enhancement for assumptions (when structural found few/none)
+        assumptions_future = None
+        if llm_enabled:
+            from discourse_engine.llm_enhancement import enhance_assumptions
+            assumptions_future = pool.submit(
+                enhance_assumptions,
+                llm_text,
+                assumptions,
+                api_key=config.llm_api_key,
+                model=config.llm_model,
+                ollama_model=config.ollama_model,
+                ollama_base=config.ollama_base,
+            )
+
+        stats = StatisticsAnalyzer().analyze(text, sentences_with_offsets=sentences_with_offsets)
+        modal_pronoun = ModalPronounAnalyzer().analyze(text, lower=lower)
+        fallacies = LogicalFallacyAnalyzer().analyze(
+            text, lower=lower, sentences_with_offsets=sentences_with_offsets
         )
+        agenda_flags = HiddenAgendaAnalyzer(lexicon_dir=config.lexicon_dir).analyze(
+            text, lower=lower, sentences_with_offsets=sentences_with_offsets
+        )
+
+        if satire_future is not None:
+            satire_prob, satire_signals = satire_future.result()
+        if assumptions_future is not None:
+            assumptions = assumptions_future.result()
 
     satire_prob = _apply_bridge_rule(satire_prob, logical_leaps)
     content_type = _content_type_from_satire(satire_prob, trigger)
 
-    stats = StatisticsAnalyzer().analyze(text)
-    modal_pronoun = ModalPronounAnalyzer().analyze(text)
-    fallacies = LogicalFallacyAnalyzer().analyze(text)
-    assumptions = HiddenAssumptionExtractor(
-        api_key=config.llm_api_key, model=config.llm_model, lexicon_dir=config.lexicon_dir
-    ).analyze(text)
-
-    # Optional LLM enhancement for assumptions (when structural found few/none)
-    if config.llm_enhance and (config.llm_api_key or config.ollama_model):
-        from discourse_engine.llm_enhancement import enhance_assumptions
-        llm_text = _prepare_llm_text(text)
-        assumptions = enhance_assumptions(
-            llm_text,
-            assumptions,
-            api_key=config.llm_api_key,
-            model=config.llm_model,
-            ollama_model=config.ollama_model,
-            ollama_base=config.ollama_base,
-        )
-    agenda_flags = HiddenAgendaAnalyzer(lexicon_dir=config.lexicon_dir).analyze(text)
     tone = ToneAnalyzer().analyze(
         text,
         word_count=stats[0],
@@ -129,6 +154,7 @@ def run_pipeline(text: str, config: Config | None = None, context_note: str | No
         hidden_agenda_flags=agenda_flags,
         modal_verbs=modal_pronoun.modal_verbs,
         pronoun_framing=modal_pronoun.pronoun_framing,
+        lower=lower,
     )
 
     # Pragmatic Tone Bridge: let hidden agenda and fallacy signals shape tone.
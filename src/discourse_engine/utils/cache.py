@@ -0,0 +1,60 @@
+"""Bounded memo of analyzer results keyed by input text."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Texts at least this long are keyed by a 128-bit digest so the cache does not pin them
+DIGEST_MIN_CHARS = 1024
+DEFAULT_MAXSIZE = 1024
+_MISSING = object()
+
+
+def text_key(text: str) -> str | bytes:
+    """Cache key for text: the string itself when short, its BLAKE2b-128 digest otherwise."""
+    if len(text) < DIGEST_MIN_CHARS:
+        return text
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ResultCache(Generic[T]):
+    """
+    LRU cache for the results of a pure analyze(text). Entries are keyed on the analyzer's
+    configuration plus the text, so instances built from different lexicons never share
+    results. Stored results are never handed out: every call returns copy(result), so a
+    caller mutating its flags cannot change what the next caller sees.
+    """
+
+    def __init__(self, copy: Callable[[T], T], maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self._copy = copy
+        self._maxsize = maxsize
+        self._data: OrderedDict[tuple[Hashable, str | bytes], T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, config: Hashable, text: str, compute: Callable[[], T]) -> T:
+        """Return a copy of the cached result for (config, text), computing it on a miss."""
+        return self.get_by_key(config, text_key(text), compute)
+
+    def get_by_key(self, config: Hashable, input_key: str | bytes, compute: Callable[[], T]) -> T:
+        """As get, for inputs that are not one text and whose caller builds the key itself."""
+        key = (config, input_key)
+        with self._lock:
+            result = self._data.get(key, _MISSING)
+            if result is not _MISSING:
+                self._data.move_to_end(key)
+                return self._copy(result)
+        result = compute()
+        with self._lock:
+            self._data[key] = result
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return self._copy(result)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,258 @@
+"""Multi-pattern scanning for rule tables."""
+
+import os
+import re
+import sys
+from bisect import bisect_right
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+Hits = dict[Hashable, tuple[int, str]]
+# (key, patterns) or (key, patterns, canaries)
+Rule = tuple[Hashable, Sequence[re.Pattern | str]] | tuple[Hashable, Sequence[re.Pattern | str], Sequence[str]]
+
+# sre holds the GIL while matching, so threads only help on free-threaded builds (3.13t+)
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+# Below this many characters a thread pool costs more than it saves
+PARALLEL_MIN_CHARS = 100_000
+
+# Escapes that spell out a literal character (hex, unicode, named, octal) may hide uppercase
+_LITERAL_ESCAPE = re.compile(r"\\[xuUN0-7]")
+_ESCAPE_OR_CHAR = re.compile(r"\\.|.", re.DOTALL)
+
+
+def fold_pattern(pattern: re.Pattern) -> re.Pattern | None:
+    """
+    Return a case-sensitive twin of an IGNORECASE pattern for matching pre-lowered text,
+    or None when the pattern is case-sensitive or its source cannot be lowered safely.
+    Escapes are kept verbatim (\\B, \\W and friends mean the same on lowered text).
+    """
+    if not pattern.flags & re.IGNORECASE or not isinstance(pattern.pattern, str):
+        return None
+    if _LITERAL_ESCAPE.search(pattern.pattern):
+        return None
+    source = _ESCAPE_OR_CHAR.sub(lambda m: m.group(0) if len(m.group(0)) > 1 else m.group(0).lower(), pattern.pattern)
+    return re.compile(source, pattern.flags & ~re.IGNORECASE)
+
+
+def trie_alternation(words: Iterable[str]) -> str:
+    """
+    Regex source matching exactly the given literal words, with shared prefixes factored out
+    ("ira(?:n|q)" rather than "iran|iraq"). sre tries alternatives one by one, so the
+    factored form rejects a position after one character test per branch point instead of
+    one per word. Wrap it in a group before adding anchors or boundaries.
+    """
+    tree: dict[str, dict] = {}
+    for word in words:
+        node = tree
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # A word ends here: what follows is optional
+            return body + "?" if len(branches) > 1 else "(?:" + body + ")?"
+        return body
+
+    return emit(tree)
+
+
+def _first_per_segment(
+    pattern: re.Pattern,
+    text: str,
+    segments: Sequence[tuple[int, int]],
+    seg_starts: list[int],
+) -> dict[int, re.Match]:
+    """Return {segment index: earliest match} for one pattern, searching text left to right."""
+    found: dict[int, re.Match] = {}
+    pos, last = segments[0][0], segments[-1][1]
+    while True:
+        m = pattern.search(text, pos, last)
+        if m is None:
+            break
+        start = m.start()
+        idx = bisect_right(seg_starts, start) - 1
+        seg_end = segments[idx][1]
+        if start < seg_end:
+            if m.end() > seg_end:
+                # Runs past the segment end: redo the search confined to this segment
+                m = pattern.search(text, start, seg_end)
+            if m is not None:
+                found[idx] = m
+        # Matches begin within or between segments; resume at the next one either way
+        if idx + 1 == len(segments):
+            break
+        pos = segments[idx + 1][0]
+    return found
+
+
+class RuleScanner:
+    """
+    Scan text for many rules, each a key plus one or more patterns.
+    A rule's hit is its earliest match across its patterns (first pattern wins ties, as in
+    an alternation). Patterns are searched individually rather than fused into one big
+    alternation: each compiled pattern keeps sre's literal-prefix skipping, which a fused
+    alternation loses, and after a hit the search jumps straight to the next segment.
+
+    IGNORECASE patterns are matched case-sensitively against the lowercased text, which
+    avoids case folding at every step; hit offsets and matched text refer to the original.
+
+    A rule may also list canaries: lowercase literals at least one of which every match
+    must contain. When none occurs in the lowercased text the rule's patterns are skipped.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Rule],
+        flags: int = re.IGNORECASE,
+    ) -> None:
+        self._rules: list[tuple[Hashable, tuple[tuple[re.Pattern, re.Pattern | None], ...], tuple[str, ...]]] = []
+        for key, patterns, *canaries in rules:
+            if patterns:
+                compiled = [p if isinstance(p, re.Pattern) else re.compile(p, flags) for p in patterns]
+                paired = tuple((p, fold_pattern(p)) for p in compiled)
+                self._rules.append((key, paired, tuple(canaries[0]) if canaries else ()))
+        self._needs_lower = any(
+            canaries or any(folded for _, folded in paired) for _, paired, canaries in self._rules
+        )
+
+    def first_matches(self, text: str, lower: str | None = None) -> Hits:
+        """Return {rule key: (start, matched text)} for the earliest match of each rule."""
+        return self.first_matches_by_segment(text, [(0, len(text))], lower)[0]
+
+    def first_matches_by_segment(
+        self,
+        text: str,
+        segments: Sequence[tuple[int, int]],
+        lower: str | None = None,
+    ) -> list[Hits]:
+        """
+        Return per-segment hits as if each (start, end) span were scanned alone.
+        Segments must be sorted and non-overlapping; text outside every segment is ignored.
+        Each span must hold exactly the text the caller would otherwise scan: a span that
+        bridges dropped text or differs from its sentence string yields hits for the span.
+        Callers that already hold text.lower() can pass it as lower to skip another copy.
+        """
+        results: list[Hits] = [{} for _ in segments]
+        if not segments:
+            return results
+        seg_starts = [start for start, _ in segments]
+        if lower is None:
+            lower = text.lower() if self._needs_lower else ""
+        # Folded patterns run on the lowered text only while its offsets line up with text
+        # (a few characters, such as dotted capital I, lowercase to two code points)
+        fold = len(lower) == len(text)
+        active = [rule for rule in self._rules if not rule[2] or any(c in lower for c in rule[2])]
+
+        def scan(rule: tuple) -> tuple[Hashable, dict[int, re.Match]]:
+            key, patterns, _ = rule
+            best: dict[int, re.Match] = {}
+            for pattern, folded in patterns:
+                if folded is not None and fold:
+                    per_segment = _first_per_segment(folded, lower, segments, seg_starts)
+                else:
+                    per_segment = _first_per_segment(pattern, text, segments, seg_starts)
+                for idx, m in per_segment.items():
+                    if idx not in best or m.start() < best[idx].start():
+                        best[idx] = m
+            return key, best
+
+        # Rules share no state, so on long text they can be scanned concurrently
+        if FREE_THREADED and len(text) >= PARALLEL_MIN_CHARS and len(active) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(active), os.cpu_count() or 1)) as pool:
+                scanned = list(pool.map(scan, active))
+        else:
+            scanned = [scan(rule) for rule in active]
+        for key, best in scanned:
+            for idx, m in best.items():
+                # Report the original-case text even when the match came from the lowered view
+                results[idx][key] = (m.start(), text[m.start():m.end()])
+        return results
+
+
+class KeywordScanner:
+    """
+    Find the first whole-word hit of several disjoint keyword sets in one pass.
+    All words go into a single alternation, and each hit is mapped back to the set it came
+    from, so K keyword sets cost one scan of the text instead of K. Words must be single
+    tokens (letters, digits, "_") and belong to exactly one set; then at most one word can
+    match at any position and the results equal a separate search per set. Hits use the
+    same {key: (start, matched text)} shape as RuleScanner, so the two can be merged.
+    """
+
+    def __init__(self, keyword_sets: Mapping[Hashable, Iterable[str]]) -> None:
+        self._key_of: dict[str, Hashable] = {}
+        for key, words in keyword_sets.items():
+            for word in words:
+                word = word.lower()
+                if not re.fullmatch(r"\w+", word):
+                    raise ValueError(f"keyword {word!r} is not a single word")
+                if self._key_of.setdefault(word, key) != key:
+                    raise ValueError(f"keyword {word!r} belongs to more than one set")
+        self._n_keys = len(set(self._key_of.values()))
+        alternation = "|".join(sorted(self._key_of, key=len, reverse=True))
+        self._pattern = re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+        self._lower_pattern = fold_pattern(self._pattern)
+
+    def _key_by_casefold_match(self, matched: str) -> Hashable:
+        """Key for an IGNORECASE hit whose str.lower() differs from re's folding (rare)."""
+        return next(k for w, k in self._key_of.items() if re.fullmatch(w, matched, re.IGNORECASE))
+
+    def first_matches_by_segment(
+        self,
+        text: str,
+        segments: Sequence[tuple[int, int]],
+        lower: str | None = None,
+    ) -> list[Hits]:
+        """
+        Return per-segment hits as if each (start, end) span were scanned alone.
+        As with RuleScanner, each span must hold exactly the text the caller would otherwise scan.
+        """
+        results: list[Hits] = [{} for _ in segments]
+        if not segments or not self._key_of:
+            return results
+        if lower is None:
+            lower = text.lower()
+        if len(lower) == len(text):
+            pattern, haystack = self._lower_pattern, lower
+        else:
+            pattern, haystack = self._pattern, text
+        seg_starts = [start for start, _ in segments]
+        key_of = self._key_of
+        pos, last = segments[0][0], segments[-1][1]
+        while True:
+            m = pattern.search(haystack, pos, last)
+            if m is None:
+                break
+            start = m.start()
+            idx = bisect_right(seg_starts, start) - 1
+            seg_end = segments[idx][1]
+            if start < seg_end:
+                if m.end() > seg_end:
+                    # Runs past the segment end: redo the search confined to this segment
+                    m = pattern.search(haystack, start, seg_end)
+                    pos = seg_end
+                else:
+                    pos = m.end()
+                if m is not None:
+                    hits = results[idx]
+                    key = key_of.get(m.group(0).lower())
+                    if key is None:
+                        key = self._key_by_casefold_match(m.group(0))
+                    if key not in hits:
+                        hits[key] = (m.start(), text[m.start():m.end()])
+                        if len(hits) == self._n_keys:
+                            # Every set already hit here: nothing left to find in this segment
+                            pos = seg_end
+            else:
+                pos = start
+            if pos >= seg_end:
+                if idx + 1 == len(segments):
+                    break
+                pos = max(pos, segments[idx + 1][0])
+        return results
@@ -2,6 +2,12 @@
 
 import re
 
+# Don't split on period when followed by letter (a.m., p.m., U.S., etc.)
+_SENTENCE_RE = re.compile(r"([^.!?]*[.!?])(?!\w)(?:\s+|$)", re.DOTALL)
+# Non-word characters other than whitespace: stripping them from the whole text and then
+# splitting gives each whitespace token with its non-word characters removed
+PUNCT_RE = re.compile(r"[^\w\s]+")
+
 
 def split_sentences(text: str) -> list[str]:
     """Split text into sentences. Uses same logic as split_sentences_with_offsets."""
@@ -19,9 +25,7 @@ def split_sentences_with_offsets(text: str) -> list[tuple[str, int, int]]:
     if not text or not text.strip():
         return []
     result: list[tuple[str, int, int]] = []
-    # Don't split on period when followed by letter (a.m., p.m., U.S., etc.)
-    pattern = re.compile(r"([^.!?]*[.!?])(?!\w)(?:\s+|$)", re.DOTALL)
-    for m in pattern.finditer(text):
+    for m in _SENTENCE_RE.finditer(text):
         s = m.group(1).strip()
         # Skip abbreviation fragments like "m." or "a." from "3 a.m."
         if s and len(s) > 2:
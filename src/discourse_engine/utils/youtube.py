@@ -1,12 +1,37 @@
 """YouTube transcript fetching utilities."""
 
 import json
+import os
 import re
+import tempfile
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
 from urllib.parse import parse_qs, urlparse, quote
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
+_SHORT_URL_RE = re.compile(r"youtu\.be/([\w-]+)")
+_EMBED_PATH_RE = re.compile(r"/(?:embed|v)/([\w-]{11})")
+_TRANSCRIPT_MARKER_RE = re.compile(r"\s*\[[\w\s]+\]\s*", re.IGNORECASE)
+_REPEATED_PERIODS_RE = re.compile(r"\.\s*\.+")
+# Directory for cached transcripts when fetch_transcript is not given one; unset disables caching
+TRANSCRIPT_CACHE_ENV = "DISCOURSE_YT_CACHE"
 
+
+def _is_video_id(s: str) -> bool:
+    """True if stripped s is 11 word characters or dashes, as ^[\\w-]{11}$ tests, without re."""
+    # re's \w is str.isalnum() plus "_"; swapping "-" and "_" for a letter keeps the test exact
+    return len(s) == 11 and s.replace("-", "a").replace("_", "a").isalnum()
+
+
+def _join_snippets(snippets: Iterable) -> str:
+    """Join transcript snippet texts with spaces, newlines turned into spaces."""
+    # Replacing per snippet avoids a second transcript-sized copy of the joined text
+    return " ".join(snippet.text.replace("\n", " ") for snippet in snippets).strip()
+
+
+@lru_cache(maxsize=1024)
 def extract_video_id(url_or_id: str) -> str | None:
     """Extract YouTube video ID from a URL or return the string if it's already an ID.
 
@@ -22,12 +47,12 @@ def extract_video_id(url_or_id: str) -> str | None:
         return None
 
     # Already a video ID (11 chars, alphanumeric + - _)
-    if re.match(r"^[\w-]{11}$", s):
+    if _is_video_id(s):
         return s
 
     # youtu.be short format
     if "youtu.be/" in s:
-        match = re.search(r"youtu\.be/([\w-]+)", s)
+        match = _SHORT_URL_RE.search(s)
         return match.group(1) if match else None
 
     # Standard YouTube URLs
@@ -38,7 +63,7 @@ def extract_video_id(url_or_id: str) -> str | None:
             vid = qs.get("v", [None])[0]
             return vid if vid and len(vid) == 11 else None
         # /embed/VIDEO_ID or /v/VIDEO_ID
-        match = re.search(r"/(?:embed|v)/([\w-]{11})", parsed.path)
+        match = _EMBED_PATH_RE.search(parsed.path)
         return match.group(1) if match else None
 
     return None
@@ -81,12 +106,53 @@ def get_video_metadata(url_or_id: str) -> dict[str, str | None]:
     }
 
 
-def fetch_transcript(url_or_id: str, languages: list[str] | None = None) -> tuple[str, str | None]:
+def _transcript_cache_path(cache_dir: str | Path | None, video_id: str, languages: list[str]) -> Path | None:
+    """Cache file for a (video, languages) fetch, or None when caching is off."""
+    if cache_dir is None:
+        cache_dir = os.environ.get(TRANSCRIPT_CACHE_ENV)
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / f"{video_id}_{quote('_'.join(languages), safe='')}.json"
+
+
+def _read_cached_transcript(path: Path) -> tuple[str, str | None] | None:
+    """Cached (cleaned_text, context_note), or None when missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data["text"], data["context_note"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cached_transcript(path: Path, result: tuple[str, str | None]) -> None:
+    """Store a fetch result; written to a temp file and renamed so readers never see a partial file."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"text": result[0], "context_note": result[1]}, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # The cache is best effort; the fetched transcript is still returned
+
+
+def fetch_transcript(
+    url_or_id: str,
+    languages: list[str] | None = None,
+    cache_dir: str | Path | None = None,
+) -> tuple[str, str | None]:
     """Fetch transcript from a YouTube video and return cleaned text plus optional context note.
 
     Args:
         url_or_id: YouTube URL or 11-character video ID.
         languages: Preferred language codes (e.g. ['en', 'de']). Defaults to ['en'].
+        cache_dir: Directory caching results per video and languages, so repeat fetches skip
+            the network. Defaults to $DISCOURSE_YT_CACHE; no caching when neither is set.
 
     Returns:
         (cleaned_text, context_note): cleaned transcript and optional interpretation note
@@ -95,13 +161,6 @@ def fetch_transcript(url_or_id: str, languages: list[str] | None = None) -> tupl
     Raises:
         ValueError: If video ID cannot be extracted or transcript is unavailable.
     """
-    from youtube_transcript_api import (
-        YouTubeTranscriptApi,
-        TranscriptsDisabled,
-        NoTranscriptFound,
-        VideoUnavailable,
-    )
-
     video_id = extract_video_id(url_or_id)
     if not video_id:
         raise ValueError(
@@ -112,6 +171,19 @@ def fetch_transcript(url_or_id: str, languages: list[str] | None = None) -> tupl
     if languages is None:
         languages = ["en"]
 
+    cache_path = _transcript_cache_path(cache_dir, video_id, languages)
+    if cache_path is not None:
+        cached = _read_cached_transcript(cache_path)
+        if cached is not None:
+            return cached
+
+    from youtube_transcript_api import (
+        YouTubeTranscriptApi,
+        TranscriptsDisabled,
+        NoTranscriptFound,
+        VideoUnavailable,
+    )
+
     try:
         fetched = YouTubeTranscriptApi().fetch(video_id, languages=languages)
     except TranscriptsDisabled:
@@ -125,9 +197,11 @@ def fetch_transcript(url_or_id: str, languages: list[str] | None = None) -> tupl
         raise ValueError(f"Video unavailable or does not exist: {video_id}")
 
     # FetchedTranscript is iterable; each item is FetchedTranscriptSnippet with .text
-    texts = [snippet.text for snippet in fetched]
-    raw = " ".join(texts).replace("\n", " ").strip()
-    return preprocess_transcript(raw), detect_comedic_context(raw)
+    raw = _join_snippets(fetched)
+    result = preprocess_transcript(raw), detect_comedic_context(raw)
+    if cache_path is not None:
+        _write_cached_transcript(cache_path, result)
+    return result
 
 
 def detect_comedic_context(text: str) -> str | None:
@@ -166,18 +240,23 @@ def preprocess_transcript(text: str) -> str:
         return text
     # Replace transcript markers with period+space to create sentence boundaries
     # This prevents run-on "sentences" and removes noise from pattern matching
-    pattern = re.compile(r"\s*\[[\w\s]+\]\s*", re.IGNORECASE)
-    cleaned = pattern.sub(". ", text)
-    # Collapse multiple spaces and repeated periods
-    cleaned = re.sub(r"\s+", " ", cleaned)
-    cleaned = re.sub(r"\.\s*\.+", ". ", cleaned)
-    cleaned = cleaned.strip()
+    cleaned = _TRANSCRIPT_MARKER_RE.sub(". ", text) if "[" in text else text
+    # Collapse whitespace runs (str.split() and re's \s agree on what whitespace is); the
+    # ends can go now since repeated-period matches never include them
+    cleaned = " ".join(cleaned.split())
+    # Collapse repeated periods; with whitespace collapsed a match starts with ".." or ". ."
+    if ".." in cleaned or ". ." in cleaned:
+        cleaned = _REPEATED_PERIODS_RE.sub(". ", cleaned).strip()
     return cleaned
 
 
-def fetch_transcript_only(url_or_id: str, languages: list[str] | None = None) -> str:
+def fetch_transcript_only(
+    url_or_id: str,
+    languages: list[str] | None = None,
+    cache_dir: str | Path | None = None,
+) -> str:
     """Fetch transcript and return only the cleaned text (no context note)."""
-    text, _ = fetch_transcript(url_or_id, languages)
+    text, _ = fetch_transcript(url_or_id, languages, cache_dir)
     return text
 
 
@@ -254,8 +333,8 @@ def fetch_transcript_with_translation(
             translated_snippets = original_snippets
 
     # Build text strings
-    raw_original = " ".join(s.text for s in original_snippets).replace("\n", " ").strip()
-    raw_translated = " ".join(s.text for s in translated_snippets).replace("\n", " ").strip()
+    raw_original = _join_snippets(original_snippets)
+    raw_translated = _join_snippets(translated_snippets)
     original_text = preprocess_transcript(raw_original)
     translated_text = preprocess_transcript(raw_translated)
 
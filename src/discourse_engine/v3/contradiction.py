@@ -6,6 +6,8 @@ Uses heuristic methods (extensible to NLI models).
 
 import re
 
+from discourse_engine.utils.patterns import trie_alternation
+from discourse_engine.utils.text_utils import PUNCT_RE
 from discourse_engine.v3.models import ContradictionPair, ContradictionReport
 
 
@@ -14,28 +16,31 @@ NEGATION_VERBS = {"deny", "reject", "refuse", "dispute", "contradict"}
 HEDGING = {"perhaps", "maybe", "might", "could", "possibly", "sometimes", "allegedly"}
 QUESTION_WORDS = {"what", "when", "where", "why", "how", "who", "which"}
 
+_WORD3_RE = re.compile(r"\b\w{3,}\b")
+# Any whole word in NEGATIONS; stops at the first one instead of collecting every word
+_NEGATION_WORD_RE = re.compile(rf"\b(?:{trie_alternation(NEGATIONS)})\b")
 
-def _has_negation(text: str) -> bool:
-    lower = text.lower()
-    words = set(re.findall(r"\b\w+\b", lower))
-    return bool(words & NEGATIONS) or any(v in lower for v in NEGATION_VERBS)
 
+def _has_negation(lower: str) -> bool:
+    return _NEGATION_WORD_RE.search(lower) is not None or any(v in lower for v in NEGATION_VERBS)
 
-def _semantic_overlap(text_a: str, text_b: str) -> float:
-    words_a = set(re.findall(r"\b\w{3,}\b", text_a.lower()))
-    words_b = set(re.findall(r"\b\w{3,}\b", text_b.lower()))
+
+def _content_words(lower: str) -> frozenset[str]:
+    return frozenset(_WORD3_RE.findall(lower))
+
+
+def _semantic_overlap(words_a: frozenset[str], words_b: frozenset[str]) -> float:
     if not words_a or not words_b:
         return 0.0
     overlap = len(words_a & words_b) / min(len(words_a), len(words_b))
     return min(overlap, 1.0)
 
 
-def _hedging_density(text: str) -> float:
-    lower = text.lower()
+def _hedging_density(lower: str) -> float:
     words = lower.split()
     if not words:
         return 0.0
-    count = sum(1 for w in words if re.sub(r"\W", "", w) in HEDGING)
+    count = sum(1 for w in PUNCT_RE.sub("", lower).split() if w in HEDGING)
     return count / len(words)
 
 
@@ -63,30 +68,48 @@ class ContradictionAnalyzer:
         evasion_count = 0
         question_count = 0
 
+        # Every turn but the ends is compared twice (as reply, then as prompt): derive its
+        # lowercase text and negation once, in columns aligned with turns. Content words are
+        # only needed by pairs that reach an overlap test, so they are filled in on demand.
+        lowers = [text.lower() for _, text in turns]
+        negated = [_has_negation(lower) for lower in lowers]
+        content_words: list[frozenset[str] | None] = [None] * len(turns)
+
+        def words_at(j: int) -> frozenset[str]:
+            words = content_words[j]
+            if words is None:
+                words = content_words[j] = _content_words(lowers[j])
+            return words
+
         for i in range(len(turns) - 1):
             speaker_a, text_a = turns[i]
             speaker_b, text_b = turns[i + 1]
-            overlap = _semantic_overlap(text_a, text_b)
-            neg_a, neg_b = _has_negation(text_a), _has_negation(text_b)
-
-            if neg_a != neg_b and overlap >= min_overlap and len(text_a) > 20 and len(text_b) > 20:
-                prob = min(0.5 + overlap * 0.5, 0.9)
-                pairs.append(
-                    ContradictionPair(
-                        speaker_a=speaker_a,
-                        text_a=text_a[:200] + ("..." if len(text_a) > 200 else ""),
-                        speaker_b=speaker_b,
-                        text_b=text_b[:200] + ("..." if len(text_b) > 200 else ""),
-                        probability=prob,
-                        contradiction_type="direct",
-                        explanation="Negation in one utterance with semantic overlap in the other.",
+            overlap: float | None = None
+
+            # Cheap gates first: short turns and pairs agreeing on negation never contradict
+            if len(text_a) > 20 and len(text_b) > 20 and negated[i] != negated[i + 1]:
+                overlap = _semantic_overlap(words_at(i), words_at(i + 1))
+                if overlap >= min_overlap:
+                    prob = min(0.5 + overlap * 0.5, 0.9)
+                    pairs.append(
+                        ContradictionPair(
+                            speaker_a=speaker_a,
+                            text_a=text_a[:200] + ("..." if len(text_a) > 200 else ""),
+                            speaker_b=speaker_b,
+                            text_b=text_b[:200] + ("..." if len(text_b) > 200 else ""),
+                            probability=prob,
+                            contradiction_type="direct",
+                            explanation="Negation in one utterance with semantic overlap in the other.",
+                        )
                     )
-                )
 
             if _is_question(text_a):
                 question_count += 1
-                if _hedging_density(text_b) > 0.1 and overlap < 0.3:
-                    evasion_count += 1
+                if _hedging_density(lowers[i + 1]) > 0.1:
+                    if overlap is None:
+                        overlap = _semantic_overlap(words_at(i), words_at(i + 1))
+                    if overlap < 0.3:
+                        evasion_count += 1
 
         reframing_detected = len(pairs) > 0
         evasion_likelihood = evasion_count / (question_count + 1)
@@ -6,6 +6,7 @@ Produces heatmap grid data for visualization.
 
 import re
 
+from discourse_engine.utils.text_utils import PUNCT_RE
 from discourse_engine.v3.models import DebateHeatmapReport, TurnMetrics
 
 
@@ -17,32 +18,27 @@ INTENSITY_TERMS = {
 DOMINANCE_TERMS = {"must", "shall", "will", "cannot", "never", "always", "everyone"}
 CERTAINTY_MODALS = {"must", "will", "shall", "cannot"}
 
-
-def _intensity_score(text: str) -> float:
-    lower = text.lower()
-    words = re.findall(r"\b\w+\b", lower)
-    if not words:
-        return 0.0
-    count = sum(1 for w in words if w in INTENSITY_TERMS)
-    return min(count / len(words) * 10, 1.0)
+_WORD_RE = re.compile(r"\b\w+\b")
 
 
-def _dominance_score(text: str) -> float:
+def _turn_scores(text: str) -> tuple[float, float, float, int]:
+    """Return (intensity, dominance, certainty, word count) from one lowercase copy of text."""
     lower = text.lower()
-    words = lower.split()
-    if not words:
-        return 0.0
-    count = sum(1 for w in words if re.sub(r"\W", "", w) in DOMINANCE_TERMS)
-    return min(count / len(words) * 5, 1.0)
-
-
-def _certainty_score(text: str) -> float:
-    lower = text.lower()
-    words = lower.split()
-    if not words:
-        return 0.0
-    count = sum(1 for w in words if re.sub(r"\W", "", w) in CERTAINTY_MODALS)
-    return min(count / len(words) * 8, 1.0)
+    word_count = len(lower.split())
+    # Intensity counts \w+ runs; dominance and certainty count whitespace tokens
+    words = _WORD_RE.findall(lower)
+    intensity = 0.0
+    if words:
+        intensity = min(sum(1 for w in words if w in INTENSITY_TERMS) / len(words) * 10, 1.0)
+    if not word_count:
+        return intensity, 0.0, 0.0, 0
+    dominance = certainty = 0
+    for w in PUNCT_RE.sub("", lower).split():
+        if w in DOMINANCE_TERMS:
+            dominance += 1
+        if w in CERTAINTY_MODALS:
+            certainty += 1
+    return intensity, min(dominance / word_count * 5, 1.0), min(certainty / word_count * 8, 1.0), word_count
 
 
 class DebateHeatmapAnalyzer:
@@ -70,47 +66,40 @@ class DebateHeatmapAnalyzer:
         speakers = list(dict.fromkeys(s[0] for s in turns))
         speaker_to_idx = {s: i for i, s in enumerate(speakers)}
 
+        # Heatmap grid: rows=speakers, cols=time_bins; turns past the last full bin are left out
+        bin_size = max(1, len(turns) // self.time_bins)
+        heatmap = [[0.0] * self.time_bins for _ in speakers]
+        escalation: list[float] = []
+        influence_sums = [0.0] * len(speakers)
+        turn_counts = [0] * len(speakers)
+
         turn_metrics: list[TurnMetrics] = []
         for idx, (speaker_id, text) in enumerate(turns):
+            intensity, dominance, certainty, word_count = _turn_scores(text)
             turn_metrics.append(
                 TurnMetrics(
                     speaker_id=speaker_id,
                     turn_idx=idx,
                     text=text[:100] + ("..." if len(text) > 100 else ""),
-                    emotional_intensity=_intensity_score(text),
-                    dominance_score=_dominance_score(text),
-                    certainty_score=_certainty_score(text),
-                    word_count=len(text.split()),
+                    emotional_intensity=intensity,
+                    dominance_score=dominance,
+                    certainty_score=certainty,
+                    word_count=word_count,
                 )
             )
-
-        # Heatmap grid: rows=speakers, cols=time_bins
-        bin_size = max(1, len(turns) // self.time_bins)
-        heatmap = [[0.0] * self.time_bins for _ in speakers]
-        for bin_idx in range(self.time_bins):
-            start = bin_idx * bin_size
-            end = min(start + bin_size, len(turns))
-            for t_idx in range(start, end):
-                t = turn_metrics[t_idx]
-                s_idx = speaker_to_idx[t.speaker_id]
-                intensity = t.emotional_intensity + t.dominance_score * 0.5
-                heatmap[s_idx][bin_idx] = max(
-                    heatmap[s_idx][bin_idx],
-                    intensity,
-                )
-
-        escalation = [t.emotional_intensity + t.dominance_score for t in turn_metrics]
-
-        influence_scores: dict[str, float] = {}
-        for s in speakers:
-            s_turns = [tm for tm in turn_metrics if tm.speaker_id == s]
-            if s_turns:
-                influence_scores[s] = sum(
-                    tm.emotional_intensity + tm.dominance_score
-                    for tm in s_turns
-                ) / len(s_turns)
-            else:
-                influence_scores[s] = 0.0
+            s_idx = speaker_to_idx[speaker_id]
+            bin_idx = idx // bin_size
+            if bin_idx < self.time_bins:
+                row = heatmap[s_idx]
+                row[bin_idx] = max(row[bin_idx], intensity + dominance * 0.5)
+            escalation.append(intensity + dominance)
+            influence_sums[s_idx] += intensity + dominance
+            turn_counts[s_idx] += 1
+
+        # Every listed speaker has at least one turn
+        influence_scores: dict[str, float] = {
+            s: influence_sums[i] / turn_counts[i] for i, s in enumerate(speakers)
+        }
 
         summary = (
             f"Analyzed {len(turns)} turns from {len(speakers)} speaker(s). "
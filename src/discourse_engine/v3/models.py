@@ -6,7 +6,7 @@ from typing import Any
 
 # --- Narrative Arc ---
 
-@dataclass
+@dataclass(slots=True)
 class ChunkMetrics:
     """Metrics for a single text chunk in narrative arc analysis."""
 
@@ -24,7 +24,7 @@ class ChunkMetrics:
     agency_passive_ratio: float  # passive voice proportion
 
 
-@dataclass
+@dataclass(slots=True)
 class LogicalLeap:
     """A problem-solution pair with low semantic coherence (potential satire or non-sequitur)."""
 
@@ -49,7 +49,7 @@ class NarrativeArcReport:
 
 # --- Contradiction ---
 
-@dataclass
+@dataclass(slots=True)
 class ContradictionPair:
     """A detected contradiction between two speaker utterances."""
 
@@ -75,7 +75,7 @@ class ContradictionReport:
 
 # --- Temporal Drift ---
 
-@dataclass
+@dataclass(slots=True)
 class DocumentProfile:
     """Rhetorical profile of a single document (for drift tracking)."""
 
@@ -88,7 +88,7 @@ class DocumentProfile:
     word_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DriftVector:
     """Change in a dimension between two documents."""
 
@@ -112,7 +112,7 @@ class TemporalDriftReport:
 
 # --- Debate Heatmap ---
 
-@dataclass
+@dataclass(slots=True)
 class TurnMetrics:
     """Metrics for a single speaker turn."""
 
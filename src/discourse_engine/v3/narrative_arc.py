@@ -9,28 +9,40 @@ Models rhetorical evolution across time within a single document:
 """
 
 import json
+import os
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
-from discourse_engine.utils.text_utils import split_sentences
+from discourse_engine.utils.patterns import FREE_THREADED
+from discourse_engine.utils.text_utils import PUNCT_RE, split_sentences
 from discourse_engine.v3.models import ChunkMetrics, LogicalLeap, NarrativeArcReport
 
 # Similarity threshold: below this = potential satire or logical leap
 LOGICAL_LEAP_SIMILARITY_THRESHOLD = 0.15
 
+# Free-threaded builds only (sre holds the GIL otherwise): documents with at least this many
+# chunks score them across a thread pool
+PARALLEL_MIN_CHUNKS = 16
 
-def _load_lexicon(lexicon_dir: Path, name: str) -> list[str]:
+
+@lru_cache(maxsize=32)
+def _load_lexicon(lexicon_dir: Path, name: str) -> tuple[str, ...]:
+    """Load a JSON lexicon file, lowercased (cached per directory and name; immutable)."""
     path = lexicon_dir / f"{name}.json"
     if not path.exists():
-        return []
+        return ()
     with open(path, encoding="utf-8") as f:
         data = json.load(f)
-    return data if isinstance(data, list) else []
+    return tuple(t.lower() for t in data if isinstance(t, str)) if isinstance(data, list) else ()
 
 
-def _count_matches(text: str, terms: list[str]) -> int:
-    lower = text.lower()
-    return sum(1 for t in terms if t.lower() in lower)
+def _count_matches(lower: str, terms: tuple[str, ...]) -> int:
+    """Count lowercase terms that occur in already-lowercased text."""
+    return sum(1 for t in terms if t in lower)
 
 
 def _count_to_normalized(count: int, word_count: int) -> float:
@@ -68,9 +80,14 @@ SOLUTION_TERMS = frozenset({
 })
 
 
+_WORD_RE = re.compile(r"\b\w+\b")
+_LETTER_WORD_RE = re.compile(r"\b[a-z]{2,}\b")
+_MODALS = frozenset({"must", "should", "could", "would", "might", "can", "will", "shall"})
+
+
 def _word_set(text: str) -> set[str]:
     """Return set of lowercase words (excluding stopwords)."""
-    words = set(re.findall(r"\b[a-z]{2,}\b", text.lower()))
+    words = set(_LETTER_WORD_RE.findall(text.lower()))
     # Minimal stopwords
     stop = {"the", "a", "an", "is", "are", "was", "were", "be", "been", "to", "of", "and", "or", "in", "on", "at"}
     return words - stop
@@ -85,26 +102,28 @@ def _cosine_similarity(s1: str, s2: str) -> float:
     return overlap / ((len(w1) * len(w2)) ** 0.5)
 
 
-def compute_logical_leaps(text: str) -> list[LogicalLeap]:
+def compute_logical_leaps(text: str, sentences: list[str] | None = None) -> list[LogicalLeap]:
     """
     Lightweight extraction of problem-solution pairs with low semantic similarity.
-    Used for Bridge Rule (satire adjustment) and LLM trigger.
+    Used for Bridge Rule (satire adjustment) and LLM trigger. Callers that already split
+    text pass split_sentences(text) as sentences.
     """
     if not text or not text.strip():
         return []
-    sentences = split_sentences(text)
+    if sentences is None:
+        sentences = split_sentences(text)
     if len(sentences) < 2:
         return []
     lower_sents = [s.lower() for s in sentences]
     result: list[LogicalLeap] = []
     for i, sent in enumerate(lower_sents):
-        words_i = set(re.findall(r"\b\w+\b", sent))
+        words_i = set(_WORD_RE.findall(sent))
         if not (words_i & PROBLEM_TERMS):
             continue
         for j, sent_j in enumerate(lower_sents):
             if j <= i or j - i > 3:
                 continue
-            words_j = set(re.findall(r"\b\w+\b", sent_j))
+            words_j = set(_WORD_RE.findall(sent_j))
             has_solution = (
                 bool(words_j & SOLUTION_TERMS)
                 or "must" in sent_j
@@ -146,11 +165,10 @@ class NarrativeArcAnalyzer:
         self._authority = _load_lexicon(self.lexicon_dir, "authority_terms")
         self._identity = _load_lexicon(self.lexicon_dir, "identity_terms")
         if not self._fear:
-            self._fear = ["collapse", "destroy", "threat", "danger", "crisis"]
+            self._fear = ("collapse", "destroy", "threat", "danger", "crisis")
 
-    def _chunk_text(self, text: str) -> list[tuple[int, int, str]]:
-        """Return [(start_idx, end_idx, chunk_text), ...]."""
-        sentences = split_sentences(text)
+    def _chunk_text(self, text: str, sentences: list[str]) -> list[tuple[int, int, str]]:
+        """Return [(start_idx, end_idx, chunk_text), ...] for text split into sentences."""
         chunks: list[tuple[int, int, str]] = []
         for i in range(0, len(sentences), self.chunk_size):
             end = min(i + self.chunk_size, len(sentences))
@@ -166,34 +184,35 @@ class NarrativeArcAnalyzer:
         start: int,
         end: int,
         chunk_text: str,
-        total_sentences: int,
+        total_chunks: int,
     ) -> ChunkMetrics:
-        words = chunk_text.split()
-        word_count = len(words)
         sent_count = end - start
         lower = chunk_text.lower()
+        # One split of the lowered chunk serves the word count and the pronoun counts
+        tokens = lower.split()
+        word_count = len(tokens)
 
         # Emotional intensity
-        intensity_count = sum(1 for w in re.findall(r"\b\w+\b", lower) if w in INTENSITY_TERMS)
+        intensity_count = sum(1 for w in _WORD_RE.findall(lower) if w in INTENSITY_TERMS)
         emotional_intensity = _count_to_normalized(intensity_count, word_count) if word_count else 0.0
 
         # Fear, authority, identity (0-1)
-        fear_count = _count_matches(chunk_text, self._fear)
-        authority_count = _count_matches(chunk_text, self._authority)
-        identity_count = _count_matches(chunk_text, self._identity)
+        fear_count = _count_matches(lower, self._fear)
+        authority_count = _count_matches(lower, self._authority)
+        identity_count = _count_matches(lower, self._identity)
         fear_score = _count_to_normalized(fear_count, word_count) if word_count else 0.0
         authority_score = _count_to_normalized(authority_count, word_count) if word_count else 0.0
         identity_score = _count_to_normalized(identity_count, word_count) if word_count else 0.0
 
         # Pronoun we/they ratio
-        we_us = sum(lower.split().count(w) for w in ("we", "us"))
-        they_them = sum(lower.split().count(w) for w in ("they", "them"))
+        token_counts = Counter(tokens)
+        we_us = token_counts["we"] + token_counts["us"]
+        they_them = token_counts["they"] + token_counts["them"]
         total_pn = we_us + they_them
         pronoun_we_they_ratio = we_us / (they_them + 1) if they_them else (we_us if we_us else 0.5)
 
         # Modal density
-        modals = {"must", "should", "could", "would", "might", "can", "will", "shall"}
-        modal_count = sum(1 for w in words if re.sub(r"\W", "", w.lower()) in modals)
+        modal_count = sum(1 for w in PUNCT_RE.sub("", lower).split() if w in _MODALS)
         modal_density = modal_count / word_count if word_count else 0.0
 
         # Threat score (fear terms)
@@ -203,7 +222,6 @@ class NarrativeArcAnalyzer:
         passive_matches = len(PASSIVE_PATTERN.findall(chunk_text))
         agency_passive_ratio = passive_matches / (sent_count + 1)
 
-        total_chunks = max(1, (total_sentences + self.chunk_size - 1) // self.chunk_size)
         position = (chunk_idx + 0.5) / total_chunks
 
         return ChunkMetrics(
@@ -233,13 +251,18 @@ class NarrativeArcAnalyzer:
                 viz_data={},
             )
 
-        chunks_data = self._chunk_text(text)
-        total_sentences = len(split_sentences(text))
-        metrics_list: list[ChunkMetrics] = []
-
-        for idx, (start, end, chunk_text) in enumerate(chunks_data):
-            m = self._analyze_chunk(idx, start, end, chunk_text, total_sentences)
-            metrics_list.append(m)
+        sentences = split_sentences(text)
+        chunks_data = self._chunk_text(text, sentences)
+        total_sentences = len(sentences)
+        total_chunks = max(1, (total_sentences + self.chunk_size - 1) // self.chunk_size)
+        # Chunks are scored independently; map keeps them in document order
+        starts, ends, chunk_texts = zip(*chunks_data)
+        columns = (range(len(chunks_data)), starts, ends, chunk_texts, repeat(total_chunks))
+        if FREE_THREADED and len(chunks_data) >= PARALLEL_MIN_CHUNKS:
+            with ThreadPoolExecutor(max_workers=min(len(chunks_data), os.cpu_count() or 1)) as pool:
+                metrics_list = list(pool.map(self._analyze_chunk, *columns))
+        else:
+            metrics_list = list(map(self._analyze_chunk, *columns))
 
         # Escalation: chunks where emotional_intensity or threat spikes
         intensities = [c.emotional_intensity + c.threat_score for c in metrics_list]
@@ -262,7 +285,7 @@ class NarrativeArcAnalyzer:
                 shifts.append((i, d))
             prev_dom = d
 
-        logical_leaps = compute_logical_leaps(text)
+        logical_leaps = compute_logical_leaps(text, sentences)
 
         summary_parts = [
             f"Analyzed {len(metrics_list)} chunks ({total_sentences} sentences).",
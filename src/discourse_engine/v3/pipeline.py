@@ -73,9 +73,21 @@ def run_debate_heatmap(turns: list[tuple[str, str]], time_bins: int = 10) -> dic
     }
 
 
-def export_viz_to_json(data: dict, path: str | Path) -> None:
-    """Export visualization data to JSON for external tools."""
+def export_viz_to_json(data: dict, path: str | Path) -> Path:
+    """
+    Export visualization data to JSON for external tools (encoded by orjson when installed).
+    Writes silently and returns the path written, for the CLI to report.
+    Both encoders write non-ASCII text as UTF-8. NaN and infinities differ: orjson writes null,
+    the json fallback writes NaN/Infinity, which only Python-style readers accept.
+    """
     path = Path(path)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    print(f"Exported viz data to {path}", flush=True)
+    try:
+        import orjson
+    except ImportError:
+        # Encoded once and written in one call instead of chunk by chunk through the text layer;
+        # ensure_ascii=False keeps non-ASCII raw, as orjson does
+        encoded = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    else:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    path.write_bytes(encoded)
+    return path
@@ -3,24 +3,40 @@
 Tracks how a speaker's rhetorical positioning shifts across multiple documents over time.
 """
 
+import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 
+from discourse_engine.utils.cache import ResultCache
+from discourse_engine.utils.patterns import FREE_THREADED
 from discourse_engine.v3.models import DocumentProfile, DriftVector, TemporalDriftReport
 
+# Drift dimensions, in DocumentProfile field order
+DIMENSIONS = ("fear", "authority", "identity", "liberty")
 
-def _load_lexicon(lexicon_dir: Path, name: str) -> list[str]:
+# Free-threaded builds only (str searches hold the GIL otherwise): at least this many
+# documents are profiled across a thread pool
+PARALLEL_MIN_DOCUMENTS = 16
+
+
+@lru_cache(maxsize=32)
+def _load_lexicon(lexicon_dir: Path, name: str) -> tuple[str, ...]:
+    """Load a JSON lexicon file, lowercased (cached per directory and name; immutable)."""
     path = lexicon_dir / f"{name}.json"
     if not path.exists():
-        return []
+        return ()
     with open(path, encoding="utf-8") as f:
         data = json.load(f)
-    return data if isinstance(data, list) else []
+    return tuple(t.lower() for t in data if isinstance(t, str)) if isinstance(data, list) else ()
 
 
-def _count_matches(text: str, terms: list[str]) -> int:
-    lower = text.lower()
-    return sum(1 for t in terms if t.lower() in lower)
+def _count_matches(lower: str, terms: tuple[str, ...]) -> int:
+    """Count lowercase terms that occur in already-lowercased text."""
+    return sum(1 for t in terms if t in lower)
 
 
 def _score_to_normalized(count: int, word_count: int) -> float:
@@ -43,20 +59,22 @@ class TemporalDriftAnalyzer:
         self._identity = _load_lexicon(self.lexicon_dir, "identity_terms")
         self._liberty = _load_lexicon(self.lexicon_dir, "liberty_terms")
         if not self._fear:
-            self._fear = ["collapse", "destroy", "threat", "danger", "crisis"]
+            self._fear = ("collapse", "destroy", "threat", "danger", "crisis")
         if not self._liberty:
-            self._liberty = ["freedom", "liberty", "free", "rights", "oppression"]
+            self._liberty = ("freedom", "liberty", "free", "rights", "oppression")
+        self._lexicons = (self._fear, self._authority, self._identity, self._liberty)
 
     def _profile_document(self, doc_id: str, date: str | None, text: str) -> DocumentProfile:
         words = text.split()
         wc = len(words)
+        lower = text.lower()
         return DocumentProfile(
             doc_id=doc_id,
             date=date,
-            fear=_score_to_normalized(_count_matches(text, self._fear), wc),
-            authority=_score_to_normalized(_count_matches(text, self._authority), wc),
-            identity=_score_to_normalized(_count_matches(text, self._identity), wc),
-            liberty=_score_to_normalized(_count_matches(text, self._liberty), wc),
+            fear=_score_to_normalized(_count_matches(lower, self._fear), wc),
+            authority=_score_to_normalized(_count_matches(lower, self._authority), wc),
+            identity=_score_to_normalized(_count_matches(lower, self._identity), wc),
+            liberty=_score_to_normalized(_count_matches(lower, self._liberty), wc),
             word_count=wc,
         )
 
@@ -70,28 +88,35 @@ class TemporalDriftAnalyzer:
         Args:
             documents: [(doc_id, date_or_none, text), ...]
         """
-        profiles: list[DocumentProfile] = []
-        for doc_id, date, text in documents:
-            if text and text.strip():
-                profiles.append(self._profile_document(doc_id, date, text))
+        # Results depend only on the document list (in order) and the four lexicons
+        key = _documents_key(documents)
+        if key is None:
+            return self._analyze(documents)
+        return _RESULTS.get_by_key(self._lexicons, key, lambda: self._analyze(documents))
 
+    def _analyze(
+        self,
+        documents: list[tuple[str, str | None, str]],
+    ) -> TemporalDriftReport:
+        # Documents are profiled independently; map keeps them in input order. Blank ones are
+        # dropped first (isspace stops at the first non-space, where strip would copy the text)
+        kept = [(doc_id, date, text) for doc_id, date, text in documents if text and not text.isspace()]
+        if FREE_THREADED and len(kept) >= PARALLEL_MIN_DOCUMENTS:
+            with ThreadPoolExecutor(max_workers=min(len(kept), os.cpu_count() or 1)) as pool:
+                profiles = list(pool.map(self._profile_document, *zip(*kept)))
+        else:
+            profiles = [self._profile_document(doc_id, date, text) for doc_id, date, text in kept]
+
+        # Each profile's scores read once, in DIMENSIONS order, then compared pairwise
+        scores = [(p.fear, p.authority, p.identity, p.liberty) for p in profiles]
         drift_vectors: list[DriftVector] = []
-        for i in range(len(profiles) - 1):
-            p1, p2 = profiles[i], profiles[i + 1]
-            for dim in ("fear", "authority", "identity", "liberty"):
-                v1 = getattr(p1, dim)
-                v2 = getattr(p2, dim)
+        for prev, cur in zip(scores, scores[1:]):
+            for dim, v1, v2 in zip(DIMENSIONS, prev, cur):
                 delta = v2 - v1
                 pct = (delta / (v1 + 0.001)) * 100 if v1 else 0
-                drift_vectors.append(
-                    DriftVector(
-                        dimension=dim,
-                        from_value=v1,
-                        to_value=v2,
-                        delta=delta,
-                        pct_change=pct,
-                    )
-                )
+                # Positional in field order (dimension, from, to, delta, pct): keyword
+                # arguments make each of these 4 * (N - 1) constructions noticeably slower
+                drift_vectors.append(DriftVector(dim, v1, v2, delta, pct))
 
         timeline_data = [
             {
@@ -115,7 +140,7 @@ class TemporalDriftAnalyzer:
 
         viz_data = {
             "timeline": timeline_data,
-            "dimensions": ["fear", "authority", "identity", "liberty"],
+            "dimensions": list(DIMENSIONS),
         }
 
         return TemporalDriftReport(
@@ -125,3 +150,39 @@ class TemporalDriftAnalyzer:
             summary=summary,
             viz_data=viz_data,
         )
+
+
+def _documents_key(documents: list[tuple[str, str | None, str]]) -> bytes | None:
+    """
+    BLAKE2b-128 digest of the document list, or None if a field is neither a string nor None.
+    Each field is fed to the hash as it is, tagged and length-prefixed so no two lists collide
+    by shifting a boundary; the corpus is never serialized or copied as a whole.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for doc in documents:
+        digest.update(b"\x02")  # document boundary
+        for field in doc:
+            if field is None:
+                digest.update(b"\x00")
+            elif isinstance(field, str):
+                data = field.encode("utf-8", "surrogatepass")
+                digest.update(b"\x01" + len(data).to_bytes(8, "little"))
+                digest.update(data)
+            else:
+                return None
+    return digest.digest()
+
+
+def _copy_report(report: TemporalDriftReport) -> TemporalDriftReport:
+    """Copy a report down to its records, rows and lists; viz_data keeps sharing the timeline."""
+    timeline = [dict(row) for row in report.timeline_data]
+    return TemporalDriftReport(
+        profiles=[replace(p) for p in report.profiles],
+        drift_vectors=[replace(d) for d in report.drift_vectors],
+        timeline_data=timeline,
+        summary=report.summary,
+        viz_data={**report.viz_data, "timeline": timeline, "dimensions": list(report.viz_data["dimensions"])},
+    )
+
+
+_RESULTS: ResultCache[TemporalDriftReport] = ResultCache(_copy_report)
@@ -611,8 +611,8 @@ def run_single_document(
                 print(f"  Problem: {ll['problem_snippet']}")
                 print(f"  Solution: {ll['solution_snippet']}")
         if args.export_viz:
-            export_path = _resolve_export_path(args.export_viz)
-            export_viz_to_json(arc["viz"], export_path)
+            written = export_viz_to_json(arc["viz"], _resolve_export_path(args.export_viz))
+            print(f"Exported viz data to {written}", file=sys.stderr)
 
     # Optional v4 outputs (pretty-print and JSON).
     if args.dialogue or args.dialogue_json:
@@ -97,3 +97,28 @@ def test_enhance_assumptions_corporate_euphemisms_trigger_llm() -> None:
         result = enhance_assumptions(text, candidates)
         assert mock_llm.called
         assert len(result) >= 1
+
+
+def test_pipeline_overlaps_llm_enhancement_calls() -> None:
+    """The satire and assumption LLM calls are in flight together, not one after the other."""
+    import threading
+
+    from discourse_engine.main import run_pipeline
+    from discourse_engine.models.config import Config
+
+    both_started = threading.Barrier(2, timeout=5)
+
+    def satire(_text, prob, signals, **_kwargs):
+        both_started.wait()
+        return prob, signals
+
+    def assumptions(_text, candidates, **_kwargs):
+        both_started.wait()
+        return candidates
+
+    with (
+        patch("discourse_engine.llm_enhancement.enhance_satire_irony", side_effect=satire),
+        patch("discourse_engine.llm_enhancement.enhance_assumptions", side_effect=assumptions),
+    ):
+        report = run_pipeline("We must act now.", Config(llm_enhance=True, ollama_model="test"))
+    assert report.word_count == 4
@@ -0,0 +1,49 @@
+"""Tests for the shared rule and keyword scanners."""
+
+import re
+
+import pytest
+
+from discourse_engine.utils.patterns import KeywordScanner, RuleScanner, trie_alternation
+
+
+def test_keyword_scanner_matches_per_set_search() -> None:
+    """One keyword pass gives the same per-segment hits as one search per set."""
+    sets = {"factive": ("know", "knew", "knows"), "repeat": ("again", "still")}
+    text = "We still KNOW it. Knowstill again, knew. It was known."
+    segments = [(0, 17), (18, 40), (41, len(text))]
+    per_set = RuleScanner(
+        (key, (rf"\b(?:{'|'.join(sorted(words, key=len, reverse=True))})\b",)) for key, words in sets.items()
+    )
+    assert KeywordScanner(sets).first_matches_by_segment(text, segments) == (
+        per_set.first_matches_by_segment(text, segments)
+    )
+    assert KeywordScanner(sets).first_matches_by_segment(text, segments)[0] == {
+        "repeat": (3, "still"),
+        "factive": (9, "KNOW"),
+    }
+
+
+def test_keyword_scanner_rejects_shared_or_multiword_keywords() -> None:
+    """Sets must be disjoint single words for the one-pass result to be exact."""
+    with pytest.raises(ValueError):
+        KeywordScanner({"a": ("all",), "b": ("all",)})
+    with pytest.raises(ValueError):
+        KeywordScanner({"a": ("no one",)})
+
+
+def test_rule_scanner_reports_original_case_after_folding() -> None:
+    """Case-insensitive rules run on lowered text but report offsets and text from the input."""
+    scanner = RuleScanner([("expert", (re.compile(r"\bexperts?\b", re.IGNORECASE),))])
+    assert scanner.first_matches("Ask the EXPERTS.") == {"expert": (8, "EXPERTS")}
+    assert scanner.first_matches("İ. Experts agree.") == {"expert": (3, "Experts")}
+
+
+def test_trie_alternation_matches_exactly_its_words() -> None:
+    """The prefix-factored alternation accepts each word and nothing else."""
+    words = {"iran", "iraq", "ir", "a.b", "ab", "abc"}
+    pattern = re.compile(rf"(?:{trie_alternation(words)})")
+    for candidate in words | {"i", "ira", "irana", "a", "axb", "abcd", ""}:
+        assert (pattern.fullmatch(candidate) is not None) == (candidate in words)
+    text = "iran and iraq, not iranian"
+    assert re.findall(rf"\b(?:{trie_alternation(words)})\b", text) == ["iran", "iraq"]
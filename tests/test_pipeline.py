@@ -26,6 +26,18 @@ def test_run_pipeline_returns_report() -> None:
     assert report.hidden_agenda_flags is not None
 
 
+def test_package_exports_resolve_lazily() -> None:
+    """Both packages list their lazy names in dir() and reject names they do not export."""
+    import discourse_engine
+    import discourse_engine.analyzers as analyzers
+
+    assert {"run_pipeline", "Report"} <= set(dir(discourse_engine))
+    assert analyzers.SatireAnalyzer.__module__ == "discourse_engine.analyzers.satire"
+    assert "SatireAnalyzer" in vars(analyzers)  # cached after the first lookup
+    with pytest.raises(AttributeError, match="no attribute 'Nope'"):
+        analyzers.Nope
+
+
 def test_tone_not_always_urgent() -> None:
     """Neutral policy text should not be labeled Urgent (modal verbs != urgency)."""
     text = (
@@ -121,6 +133,35 @@ def test_hidden_assumptions_presupposition() -> None:
     assert "presupposition" in assumption_text
 
 
+def test_hidden_assumptions_factive_matches_whole_words() -> None:
+    """Factive verbs match as whole words: inflections yes, embedded substrings no."""
+    report = run_pipeline("She acknowledged the error.")
+    assumption_text = " ".join(a.description for a in report.hidden_assumptions)
+    assert "(factive verb) [trigger: 'acknowledged']" in assumption_text
+
+    report = run_pipeline("The unknown noticeboard acknowledgement arrived late.")
+    assert not any("factive" in a.description for a in report.hidden_assumptions)
+
+
+def test_hidden_assumptions_universal_and_epistemic_triggers() -> None:
+    """Universal quantifiers match whole words; the matched word is reported as trigger."""
+    report = run_pipeline("Everybody agrees the plan failed. Obviously the plan failed.")
+    assumption_text = " ".join(a.description for a in report.hidden_assumptions)
+    assert "[trigger: 'everybody']" in assumption_text
+    assert "(epistemic shortcut) [trigger: 'obviously']" in assumption_text
+
+    report = run_pipeline("Overall the smallest tallies were recalled.")
+    assert not any("universal" in a.description for a in report.hidden_assumptions)
+
+
+def test_hidden_assumptions_matches_stay_within_sentence() -> None:
+    """A pattern split across two sentences is not attributed to either of them."""
+    text = "Let's hope for the best. Your team will decide."
+    report = run_pipeline(text)
+    assumption_text = " ".join(a.description for a in report.hidden_assumptions).lower()
+    assert "conditional guilt" not in assumption_text
+
+
 def test_hidden_assumptions_epistemic_shortcut() -> None:
     """Epistemic shortcuts (obviously, clearly) are detected."""
     text = "Obviously, we need to act now. The solution is clearly the best option."
@@ -166,6 +207,18 @@ def test_hidden_assumptions_vague_authority() -> None:
     assert "vague" in assumption_text or "authority" in assumption_text
 
 
+def test_hidden_assumptions_vague_authority_trigger_follows_pattern_order() -> None:
+    """The trigger is the first vague-authority pattern that matches, not the earliest text."""
+    from discourse_engine.analyzers.hidden_assumptions import HiddenAssumptionExtractor
+
+    flags = HiddenAssumptionExtractor().analyze("Many people say experts agree. Most people believe many say so.")
+    vague = [f.description for f in flags if f.description.startswith("Vague authority")]
+    assert vague == [
+        "Vague authority invoked without specification [trigger: 'experts']",
+        "Vague authority invoked without specification [trigger: 'many say']",
+    ]
+
+
 def test_hidden_assumptions_structural_necessity_modal() -> None:
     """Structural: 'X must adapt to survive' -> Action necessary for Outcome."""
     text = "Traditional institutions must adapt to survive."
@@ -234,6 +287,62 @@ def test_hidden_agenda_shifting_goalpost() -> None:
     assert "Scope redefinition" in agenda_techniques
 
 
+def test_hidden_agenda_overlapping_rules() -> None:
+    """Rules whose matches overlap in the text are each detected."""
+    text = "This is not genuine patriotism, it's fear."
+    report = run_pipeline(text)
+    agenda_techniques = [f.technique for f in report.hidden_agenda_flags]
+    assert "Scope redefinition" in agenda_techniques
+    assert "Boundary definition" in agenda_techniques
+
+
+def test_hidden_agenda_reports_first_pattern_in_rule_order() -> None:
+    """A rule with several patterns quotes the sentence for its first matching pattern, not the earliest match."""
+    from discourse_engine.analyzers.hidden_agenda import HiddenAgendaAnalyzer
+
+    flags = HiddenAgendaAnalyzer().analyze("Many critics agree. Experts say it failed.")
+    assert [(f.technique, f.sentence) for f in flags] == [("Vague authority", "Experts say it failed.")]
+
+
+def test_hidden_agenda_uppercase_text() -> None:
+    """Literal prefilters are case-insensitive, like the patterns they guard."""
+    text = "BUT WHAT ABOUT THEIR RECORD? MEANWHILE, PRICES ROSE."
+    report = run_pipeline(text)
+    agenda_techniques = [f.technique for f in report.hidden_agenda_flags]
+    assert "Counter-accusation" in agenda_techniques
+    assert "Topic diversion" in agenda_techniques
+
+
+def test_hidden_assumptions_trigger_keeps_case_after_length_changing_lowercase() -> None:
+    """Triggers keep original case, and offsets hold when lowercasing lengthens the text."""
+    from discourse_engine.analyzers.hidden_assumptions import HiddenAssumptionExtractor
+
+    for text in ("Experts say the Plan works.", "İstanbul is calm. Experts say the Plan works."):
+        flags = HiddenAssumptionExtractor().analyze(text)
+        vague = [f for f in flags if f.description.startswith("Vague authority")]
+        assert vague and "[trigger: 'Experts']" in vague[0].description
+        assert vague[0].sentence == "Experts say the Plan works."
+
+
+def test_hidden_assumptions_abbreviation_sentences_scan_only_their_text() -> None:
+    """Sentences merged around "a.m.", "p.m." or "U.S." match only the text they hold."""
+    from discourse_engine.analyzers.hidden_assumptions import HiddenAssumptionExtractor
+
+    extractor = HiddenAssumptionExtractor()
+    assert extractor.analyze("The vote passed. Everyone knows the deal was signed at 3 p.m. on Friday.") == []
+    assert extractor.analyze("Turnout was high. Experts say the polls closed at 8 p.m. last night.") == []
+
+    flags = extractor.analyze("We met at 9 a.m. Obviously we agreed.")
+    assert [(f.description, f.sentence) for f in flags] == [
+        ("Presents claim as obvious without justification (epistemic shortcut) [trigger: 'obviously']",
+         "Obviously we agreed."),
+    ]
+    flags = extractor.analyze("The U.S. team won. Experts say it was luck.")
+    assert [(f.description, f.sentence) for f in flags] == [
+        ("Vague authority invoked without specification [trigger: 'Experts']", "Experts say it was luck."),
+    ]
+
+
 def test_hidden_agenda_side_note() -> None:
     """Topic diversion is detected."""
     text = "The policy failed. Meanwhile, another company reported profits."
@@ -274,6 +383,14 @@ def test_hidden_agenda_emotional_framing() -> None:
     assert "Fear/threat framing" in agenda_techniques
 
 
+def test_hidden_agenda_fear_sentence_contains_term() -> None:
+    """Fear/threat framing reports the sentence where the fear term occurs."""
+    text = "The committee met on Tuesday. Global chaos threatens our sidewalks."
+    report = run_pipeline(text)
+    fear = [f for f in report.hidden_agenda_flags if f.technique == "Fear/threat framing"]
+    assert fear and fear[0].sentence == "Global chaos threatens our sidewalks."
+
+
 def test_hidden_agenda_obscuration() -> None:
     """Corporate euphemisms (right-sizing, decoupling, etc.) trigger Obscuration."""
     text = "Our Right-Sizing Initiative and strategic decoupling will optimize human capital."
@@ -324,3 +441,111 @@ def test_tone_guilt_coercive_and_false_dilemma() -> None:
     assert "Guilt/Coercive" in report.tone
     fallacies = [f.name for f in report.logical_fallacy_flags]
     assert "False Dilemma" in fallacies
+
+
+def test_analyzer_results_are_cached_as_copies() -> None:
+    """Repeated texts reuse cached results, but each caller gets its own objects."""
+    from discourse_engine.analyzers import LogicalFallacyAnalyzer
+
+    text = "Either we pass this law, or our nation will collapse."
+    first = LogicalFallacyAnalyzer().analyze(text)
+    assert first
+    first[0].confidence = -1.0
+    first.clear()
+    second = LogicalFallacyAnalyzer().analyze(text)
+    assert second and second[0].confidence >= 0.0
+    assert second == LogicalFallacyAnalyzer()._analyze(text)
+
+
+def test_false_dilemma_search_matches_fused_pattern() -> None:
+    """The split either/or search finds the same start as the fused pattern, without its blow-up."""
+    from discourse_engine.analyzers.logical_fallacy import (
+        _EITHER_WORD,
+        _OR_WORD,
+        FALSE_DILEMMA_PATTERN,
+        LogicalFallacyAnalyzer,
+    )
+
+    for text in [
+        "Either we act now, or we lose everything.",
+        "Neither side agrees. Either way, the vote is close.",
+        "Or else. Either the bill passes",
+        "either way, " * 50 + "or not",
+    ]:
+        fused = FALSE_DILEMMA_PATTERN.search(text)
+        m = _EITHER_WORD.search(text)
+        split = m if m and _OR_WORD.search(text, m.end()) else None
+        assert (fused is None) == (split is None)
+        assert fused is None or fused.start() == split.start()
+    # Thousands of "either" with no "or": quadratic for the fused pattern, linear here
+    flags = LogicalFallacyAnalyzer().analyze("Either way, we go. " * 5000)
+    assert not any(f.fallacy_type == "false_dilemma" for f in flags)
+
+
+def test_analyze_many_matches_analyze() -> None:
+    """analyze_many yields exactly what analyze returns for each text, in order."""
+    from discourse_engine.analyzers import (
+        HiddenAssumptionExtractor,
+        LogicalFallacyAnalyzer,
+        ModalPronounAnalyzer,
+        SatireAnalyzer,
+    )
+
+    texts = [
+        "Either we pass this law, or our nation will collapse.",
+        "Obviously we must act. They will never understand us.",
+        "",
+        "If we allow one small change, the universe will collapse.",
+    ]
+    for analyzer in (HiddenAssumptionExtractor(), LogicalFallacyAnalyzer(), ModalPronounAnalyzer(), SatireAnalyzer()):
+        assert list(analyzer.analyze_many(iter(texts))) == [analyzer.analyze(t) for t in texts]
+
+
+def test_appeal_to_fear_cites_first_fear_sentence() -> None:
+    """Appeal to fear cites the sentence of the earliest whole-word fear term, deterministically."""
+    from discourse_engine.analyzers import LogicalFallacyAnalyzer
+
+    text = "The crisis is critical now. I am afraid of the danger. It will destroy us."
+    fear = [f for f in LogicalFallacyAnalyzer().analyze(text) if f.fallacy_type == "appeal_to_fear"]
+    assert [f.sentence for f in fear] == ["The crisis is critical now."]
+    # A fear term inside a longer word still raises the flag
+    assert any(
+        f.fallacy_type == "appeal_to_fear" for f in LogicalFallacyAnalyzer().analyze("That was threatening.")
+    )
+
+
+def test_tone_jargon_matches_word_by_word_cleaning() -> None:
+    """Whole-text jargon extraction equals stripping and splitting each word separately."""
+    import re
+
+    from discourse_engine.analyzers.tone import JARGON_TERMS, _jargon_in_word_parts, _jargon_in_words
+
+    text = "Our hygiene-mandate, (Synergy!) and the workforce's output; al-ign right-sizing — pivot."
+    words = [w for w in text.split() if len(w) > 2]
+    cleaned = {re.sub(r"\W", "", w).lower() for w in words}
+    parts = {p.lower() for w in words for p in re.split(r"[\-\']", w) if len(p) > 2}
+    assert _jargon_in_words(text) == cleaned & JARGON_TERMS
+    assert _jargon_in_words(text) | _jargon_in_word_parts(text) == (cleaned | parts) & JARGON_TERMS
+    assert {"hygiene", "workforce"} <= _jargon_in_word_parts(text)
+
+
+def test_tone_stems_match_at_word_start_only() -> None:
+    """Defensive and fear stems match inflections, but not when buried inside another word."""
+    from discourse_engine.analyzers.tone import ToneAnalyzer
+
+    tones = ToneAnalyzer().analyze("They attacked us and the threats keep growing.")
+    assert "Defensive" in tones and "Fear-oriented" in tones
+    tones = ToneAnalyzer().analyze("We stay unafraid of the counterattack and the endangered species list.")
+    assert "Defensive" not in tones and "Fear-oriented" not in tones
+
+
+def test_trigger_profile_cache_hands_out_copies() -> None:
+    """A caller editing a cached TriggerProfile does not change the next caller's result."""
+    from discourse_engine.analyzers import TriggerProfileAnalyzer
+
+    text = "The threat is real and the danger grows; our nation must stand together."
+    first = TriggerProfileAnalyzer().analyze(text)
+    expected = first.fear_level
+    first.fear_level = "edited"
+    assert TriggerProfileAnalyzer().analyze(text).fear_level == expected
+    assert TriggerProfileAnalyzer().analyze(text) == TriggerProfileAnalyzer()._analyze(text)
@@ -77,3 +77,18 @@ def test_value_clash_satire() -> None:
     )
     prob, signals, _ = SatireAnalyzer().analyze(text)
     assert prob >= 0.25
+
+
+def test_disproportionate_matches_fused_pattern() -> None:
+    """The split cause/consequence search agrees with the fused pattern, in either order."""
+    from discourse_engine.analyzers.satire import DISPROPORTIONATE_ABSURD, _is_disproportionate
+
+    texts = [
+        "If we allow one small change, then years later chaos ruled by cats.",
+        "Chaos ruled by cats. If we allow one small change nothing happens.",
+        "When we pass a tiny tax policy the universe will collapse.",
+        "If we allow one small changeuniverse will collapse",
+        "If we allow one small change, " * 200 + "it ruled by decree.",
+    ]
+    for text in texts:
+        assert _is_disproportionate(text) == bool(DISPROPORTIONATE_ABSURD.search(text))
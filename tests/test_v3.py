@@ -25,6 +25,22 @@ def test_narrative_arc_empty() -> None:
     assert "No text" in report.summary
 
 
+def test_narrative_arc_parallel_matches_serial(monkeypatch) -> None:
+    """Scoring chunks across a thread pool gives the same report as the serial loop."""
+    from discourse_engine.v3 import narrative_arc
+
+    text = " ".join(
+        f"We must fight the threat number {i}. They will destroy our nation. "
+        "The law demands order. Perhaps we could wait. Our people are united." for i in range(20)
+    )
+    analyzer = NarrativeArcAnalyzer(chunk_size=5)
+    serial = analyzer.analyze(text)
+    monkeypatch.setattr(narrative_arc, "FREE_THREADED", True)
+    parallel = analyzer.analyze(text)
+    assert len(serial.chunks) >= narrative_arc.PARALLEL_MIN_CHUNKS
+    assert parallel == serial
+
+
 def test_contradiction_basic() -> None:
     turns = [
         ("A", "We never supported that policy."),
@@ -36,6 +52,16 @@ def test_contradiction_basic() -> None:
     assert isinstance(report.evasion_likelihood, float)
 
 
+def test_contradiction_negation_needs_whole_word() -> None:
+    """Negation words count only as whole words; negation verbs count anywhere."""
+    from discourse_engine.v3.contradiction import _has_negation
+
+    assert _has_negation("we have nothing to hide")
+    assert _has_negation("i never said it, no.")
+    assert not _has_negation("a notable knot in the nordic snow")
+    assert _has_negation("they were denying it")  # "deny" inside "denying"
+
+
 def test_temporal_drift_basic() -> None:
     docs = [
         ("s1", "2023-01", "We need freedom and liberty. The people demand rights."),
@@ -48,6 +74,56 @@ def test_temporal_drift_basic() -> None:
     assert report.profiles[1].authority > report.profiles[0].authority
 
 
+def test_temporal_drift_parallel_matches_serial(monkeypatch) -> None:
+    """Profiling documents across a thread pool keeps their order and scores."""
+    from discourse_engine.v3 import temporal_drift
+
+    docs = [
+        (f"s{i}", None, "We need freedom and liberty." if i % 2 else "The threat of collapse is real.")
+        for i in range(temporal_drift.PARALLEL_MIN_DOCUMENTS + 2)
+    ]
+    docs.insert(3, ("blank", None, "   "))
+    serial = TemporalDriftAnalyzer().analyze(docs)
+    monkeypatch.setattr(temporal_drift, "FREE_THREADED", True)
+    temporal_drift._RESULTS.clear()  # profile again instead of reusing the serial report
+    parallel = TemporalDriftAnalyzer().analyze(docs)
+    assert [p.doc_id for p in parallel.profiles] == [d[0] for d in docs if d[0] != "blank"]
+    assert parallel == serial
+
+
+def test_temporal_drift_cache_hands_out_copies() -> None:
+    """A repeat analysis is served from the cache, and editing one report leaves the next intact."""
+    docs = [
+        ("s1", "2023-01", "We need freedom and liberty. The people demand rights."),
+        ("s2", "2023-06", "Order and authority must be restored. The law protects us."),
+    ]
+    first = TemporalDriftAnalyzer().analyze(docs)
+    first.profiles[0].fear = 99.0
+    first.timeline_data[0]["fear"] = 99.0
+    first.viz_data["dimensions"].append("extra")
+    second = TemporalDriftAnalyzer().analyze(docs)
+    assert second.profiles[0].fear != 99.0
+    assert second.timeline_data[0]["fear"] != 99.0
+    assert second.viz_data["timeline"] is second.timeline_data
+    assert second.viz_data["dimensions"] == ["fear", "authority", "identity", "liberty"]
+    assert TemporalDriftAnalyzer().analyze(docs[::-1]).profiles[0].doc_id == "s2"
+
+
+def test_temporal_drift_documents_key_keeps_fields_apart() -> None:
+    """Moving text across a field or document boundary changes the key; odd fields skip the cache."""
+    from discourse_engine.v3.temporal_drift import _documents_key
+
+    keys = {
+        _documents_key([("a", None, "bc")]),
+        _documents_key([("a", "", "bc")]),
+        _documents_key([("ab", None, "c")]),
+        _documents_key([("a", None, "b"), ("c", None, "")]),
+    }
+    assert len(keys) == 4 and None not in keys
+    assert _documents_key([("a", None, "bc")]) == _documents_key([("a", None, "bc")])
+    assert _documents_key([("a", 2023, "bc")]) is None
+
+
 def test_debate_heatmap_basic() -> None:
     turns = [
         ("Alice", "We must act now. The threat is real."),
@@ -71,3 +147,27 @@ def test_narrative_arc_logical_leap() -> None:
     assert len(report.logical_leaps) >= 1
     ll = report.logical_leaps[0]
     assert ll.similarity < 0.2
+
+
+def test_export_viz_to_json_with_and_without_orjson(tmp_path, monkeypatch) -> None:
+    """Both encoders write the same JSON document, non-ASCII raw; only NaN is encoded differently."""
+    import json
+    import math
+    import sys
+
+    from discourse_engine.v3.pipeline import export_viz_to_json, run_narrative_arc
+
+    viz = run_narrative_arc("We must act. The threat is real. They will destroy us. Café society agrees.")["viz"]
+    viz["note"] = "Café – naïve"
+    assert export_viz_to_json(viz, tmp_path / "fast.json") == tmp_path / "fast.json"
+    export_viz_to_json({"score": float("nan")}, tmp_path / "fast_nan.json")
+    monkeypatch.setitem(sys.modules, "orjson", None)  # import orjson now raises ImportError
+    export_viz_to_json(viz, tmp_path / "plain.json")
+    export_viz_to_json({"score": float("nan")}, tmp_path / "plain_nan.json")
+    fast = (tmp_path / "fast.json").read_text(encoding="utf-8")
+    plain = (tmp_path / "plain.json").read_text(encoding="utf-8")
+    assert "Café – naïve" in fast and "Café – naïve" in plain
+    assert json.loads(fast) == json.loads(plain) == json.loads(json.dumps(viz))
+    # orjson writes NaN as null; the json fallback keeps Python's NaN literal
+    assert json.loads((tmp_path / "fast_nan.json").read_text(encoding="utf-8")) == {"score": None}
+    assert math.isnan(json.loads((tmp_path / "plain_nan.json").read_text(encoding="utf-8"))["score"])
@@ -2,7 +2,7 @@
 
 import pytest
 
-from discourse_engine.utils.youtube import extract_video_id, fetch_transcript
+from discourse_engine.utils.youtube import extract_video_id, fetch_transcript, preprocess_transcript
 
 
 def test_extract_video_id_from_watch_url() -> None:
@@ -25,6 +25,13 @@ def test_extract_video_id_raw_id() -> None:
     assert extract_video_id("dQw4w9WgXcQ") == "dQw4w9WgXcQ"
 
 
+def test_extract_video_id_raw_id_charset() -> None:
+    """Raw IDs may use dashes and underscores, but only 11 word characters or dashes count."""
+    assert extract_video_id("  -_-_-_-_-_-  ") == "-_-_-_-_-_-"
+    assert extract_video_id("dQw4w9WgXc.") is None
+    assert extract_video_id("dQw4w9WgXcQQ") is None
+
+
 def test_extract_video_id_invalid_returns_none() -> None:
     """Invalid or empty input returns None."""
     assert extract_video_id("") is None
@@ -32,12 +39,35 @@ def test_extract_video_id_invalid_returns_none() -> None:
     assert extract_video_id("not-a-valid-url") is None
 
 
+def test_preprocess_transcript_markers_whitespace_and_periods() -> None:
+    """Markers become sentence breaks, whitespace collapses, repeated periods merge."""
+    assert preprocess_transcript("thanks  [Applause]\n so\tanyway") == "thanks. so anyway"
+    assert preprocess_transcript(" we won...\n") == "we won."
+    assert preprocess_transcript("no markers here  at\nall") == "no markers here at all"
+
+
 def test_fetch_transcript_requires_valid_id() -> None:
     """fetch_transcript raises ValueError for invalid input."""
     with pytest.raises(ValueError, match="Could not extract"):
         fetch_transcript("")
 
 
+def test_fetch_transcript_disk_cache(tmp_path) -> None:
+    """With a cache_dir, the first fetch is stored and the repeat fetch skips the API."""
+    from types import SimpleNamespace
+    from unittest.mock import patch
+
+    snippets = [SimpleNamespace(text="We never\nsurrender"), SimpleNamespace(text="[Laughter] ok")]
+    with patch("youtube_transcript_api.YouTubeTranscriptApi.fetch", return_value=snippets) as mock_fetch:
+        first = fetch_transcript("dQw4w9WgXcQ", cache_dir=tmp_path)
+        second = fetch_transcript("https://youtu.be/dQw4w9WgXcQ", cache_dir=tmp_path)
+    assert mock_fetch.call_count == 1
+    assert first == second
+    assert first[0] == "We never surrender. ok"
+    assert first[1] is not None  # [Laughter] marks comedic context
+    assert [p.name for p in tmp_path.iterdir()] == ["dQw4w9WgXcQ_en.json"]
+
+
 def test_fetch_transcript_integration() -> None:
     """Fetch transcript from a known video (Rick Astley - has captions)."""
     text, _ = fetch_transcript("dQw4w9WgXcQ")